@@ -15,6 +15,7 @@ import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
+from boto3.s3.transfer import TransferConfig
 from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
@@ -175,6 +176,13 @@ if AWS_S3_ENDPOINT_URL and (
 # boto3 with this default bucket even when AWS_STORAGE_BUCKET_NAME is unset, so default_storage
 # must use the same bucket or opens fall back to FileSystemStorage and FileNotFoundError.
 _DEFAULT_FILES_BUCKET = "eu-fact-force-files"
+# Fichiers > 8 MiB : upload multipart, parts envoyées en parallèle (boto3 et default_storage)
+_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+AWS_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+    max_concurrency=8,
+)
 _AWS_STORAGE_BUCKET_NAME = (
     os.environ.get("AWS_STORAGE_BUCKET_NAME") or _DEFAULT_FILES_BUCKET
 )
@@ -186,6 +194,7 @@ if _AWS_STORAGE_BUCKET_NAME:
                 "bucket_name": _AWS_STORAGE_BUCKET_NAME,
                 "region_name": os.environ.get("AWS_S3_REGION_NAME", "eu-west-1"),
                 "custom_domain": False,
+                "transfer_config": AWS_S3_TRANSFER_CONFIG,
             },
         },
         "staticfiles": {
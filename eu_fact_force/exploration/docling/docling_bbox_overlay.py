@@ -100,7 +100,9 @@ def annotate_pdf(
         drawn += 1
 
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
-    pdf.save(str(output_pdf))
+    # Every drawn box adds an uncompressed content stream: compress and drop
+    # duplicate objects so the annotated copy stays close to the source size
+    pdf.save(str(output_pdf), garbage=4, deflate=True)
     pdf.close()
     return len(elements), drawn
 
@@ -1,18 +1,17 @@
 import os
 import time
 import csv
+import json
 import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import fitz as PyMuPDF
 from dotenv import load_dotenv
 from eu_fact_force.exploration.parsing_benchmarking.benchmarking.benchmark_metadata import (
-    compute_metadata_score,
-    detect_abstract,
-    detect_authors,
-    detect_doi,
-    detect_references,
-    detect_title,
+    detect_all,
 )
 from eu_fact_force.exploration.parsing_benchmarking.benchmarking.parsers import (
     parse_with_config,
@@ -44,6 +43,12 @@ OUTPUT_CSV = _PARSING_ROOT / "output" / "benchmark_results_extended.csv"
 LLAMAPARSE_API_KEY = os.getenv("LLAMA_CLOUD_API_KEY")
 FIRST_CHUNK_CHARS = 5000
 ERROR_MSG_MAX_CHARS = 200
+# Sequential by default: parse_time_s / time_per_page are only comparable across
+# runs when no other parser competes for the CPU. With --workers > 1, PyMuPDF jobs
+# go to a process pool and LlamaParse jobs to a thread pool (bounded by the API
+# rate limit); Docling stays in-process to reuse a single converter.
+BENCHMARK_WORKERS = 1
+LLAMAPARSE_MAX_CONCURRENCY = 8
 
 
 # =========================
@@ -56,42 +61,70 @@ def run_benchmark(
     selected_configs: list[str] | None = None,
     allowed_filenames: set[str] | None = None,
     docling_validate_bboxes: bool = False,
-) -> list[dict]:
+    workers: int = BENCHMARK_WORKERS,
+) -> Iterator[dict]:
     """
     Run all parser configurations on PDFs in *input_folder*.
 
     If *skip_existing* is True, skip any (file, config) combination whose
     extracted-text file already exists, and reconstruct the record from it.
 
-    Returns a list of result records.
+    With *workers* > 1, jobs run concurrently and timings are measured under
+    CPU contention, so they are not comparable with sequential runs.
+
+    Yields result records in (file, config) order, each as soon as it and every
+    record before it are finalized.
     """
     input_path = Path(input_folder)
     files = _collect_input_files(input_path=input_path, allowed_filenames=allowed_filenames)
     if not files:
-        return []
+        return
 
     dataset_variant = RAW_DATASET_VARIANT
     _print_benchmark_header(input_folder=input_folder, file_count=len(files))
 
-    results: list[dict] = []
     active_config_names = selected_configs if selected_configs is not None else list(CONFIGS.keys())
     doc_type_map = get_doc_type_map()
 
-    for file_path in files:
-        file_doc_type = doc_type_map.get(file_path.name)
-        for config_name in active_config_names:
-            results.append(
-                _run_file_config_benchmark(
-                    file_path=file_path,
-                    config_name=config_name,
-                    dataset_variant=dataset_variant,
-                    skip_existing=skip_existing,
-                    file_doc_type=file_doc_type,
-                    docling_validate_bboxes=docling_validate_bboxes,
-                )
-            )
-
-    return results
+    jobs = [
+        {
+            "file_path": file_path,
+            "config_name": config_name,
+            "dataset_variant": dataset_variant,
+            "skip_existing": skip_existing,
+            "file_doc_type": doc_type_map.get(file_path.name),
+            "docling_validate_bboxes": docling_validate_bboxes,
+        }
+        for file_path in files
+        for config_name in active_config_names
+    ]
+    if workers > 1:
+        yield from _run_jobs(jobs, workers)
+    else:
+        for job in jobs:
+            yield _run_file_config_benchmark(**job)
+
+
+def _run_jobs(jobs: list[dict], workers: int) -> Iterator[dict]:
+    """Run benchmark jobs concurrently by parser type, yielding records in job order."""
+    with (
+        ProcessPoolExecutor(max_workers=workers) as process_pool,
+        ThreadPoolExecutor(max_workers=min(workers, LLAMAPARSE_MAX_CONCURRENCY)) as thread_pool,
+    ):
+        # Submit every pooled job first, then walk the jobs in order: local jobs run
+        # inline while the pools keep working, pooled jobs wait on their own future.
+        futures: list[Future | None] = []
+        for job in jobs:
+            parser_type = CONFIGS[job["config_name"]]["type"]
+            if parser_type == "pymupdf":
+                futures.append(process_pool.submit(_run_file_config_benchmark, **job))
+            elif parser_type == "llamaparse":
+                futures.append(thread_pool.submit(_run_file_config_benchmark, **job))
+            else:
+                futures.append(None)
+
+        for job, future in zip(jobs, futures):
+            yield _run_file_config_benchmark(**job) if future is None else future.result()
 
 
 def _collect_input_files(input_path: Path, allowed_filenames: set[str] | None) -> list[Path]:
@@ -99,7 +132,16 @@ def _collect_input_files(input_path: Path, allowed_filenames: set[str] | None) -
         print(f"[WARN] Input folder {input_path} not found — skipping.")
         return []
 
-    files = sorted(f for f in input_path.iterdir() if f.suffix.lower() == ".pdf")
+    # scandir: file type comes from the directory entry, no Path/stat per entry
+    with os.scandir(input_path) as entries:
+        files = sorted(
+            (
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(".pdf") and entry.is_file(follow_symlinks=False)
+            ),
+            key=lambda p: p.name,
+        )
     if allowed_filenames is not None:
         files = [f for f in files if f.name in allowed_filenames]
     if not files:
@@ -113,7 +155,10 @@ def _print_benchmark_header(input_folder: str, file_count: int) -> None:
     print(f"{'='*60}\n")
 
 
+@lru_cache(maxsize=None)
 def _estimate_pdf_pages(file_path: Path) -> int:
+    # Cached per process: sequential runs open each PDF once for all its configs;
+    # with --workers > 1 every pool process keeps its own cache
     try:
         with PyMuPDF.open(str(file_path)) as doc:
             return len(doc)
@@ -161,21 +206,29 @@ def _build_record_from_extracted_text(
         "word_count": len(full_text.split()),
         "char_count": len(full_text),
         "num_documents": num_docs,
-        "has_doi": detect_doi(full_text),
-        "has_abstract": detect_abstract(full_text),
-        "has_references": detect_references(full_text),
-        "has_title": detect_title(first_chunk),
-        "has_authors": detect_authors(first_chunk),
-        "metadata_score": 0,
+        **detect_all(full_text, first_chunk),
         "status": status,
     }
-    record["metadata_score"] = compute_metadata_score(record)
     return record
 
 
+def _meta_path(out_file: Path) -> Path:
+    return out_file.with_suffix(".meta.json")
+
+
+def _read_cached_pages(out_file: Path) -> int | None:
+    """Page count stored next to a cached extraction, so the PDF need not be reopened."""
+    try:
+        return int(json.loads(_meta_path(out_file).read_text(encoding="utf-8"))["pages"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
 def _build_cached_record(file_path: Path, output_config_name: str, out_file: Path) -> dict:
     full_text = out_file.read_text(encoding="utf-8")
-    pages = _estimate_pdf_pages(file_path)
+    pages = _read_cached_pages(out_file)
+    if pages is None:
+        pages = _estimate_pdf_pages(file_path)
     return _build_record_from_extracted_text(
         file_path=file_path,
         parser_config_name=output_config_name,
@@ -219,12 +272,13 @@ def _resolve_cache_file(
     )
 
 
-def _persist_parse_outputs(*, out_file: Path, raw_text: str, full_text: str) -> None:
-    """Write canonical, raw, and processed extraction snapshots."""
+def _persist_parse_outputs(*, out_file: Path, raw_text: str, full_text: str, pages: int) -> None:
+    """Write canonical, raw, and processed extraction snapshots, plus a page-count sidecar."""
     out_file.parent.mkdir(parents=True, exist_ok=True)
     out_file.with_suffix(".raw.txt").write_text(raw_text, encoding="utf-8")
     out_file.with_suffix(".processed.txt").write_text(full_text, encoding="utf-8")
     out_file.write_text(full_text, encoding="utf-8")
+    _meta_path(out_file).write_text(json.dumps({"pages": pages}), encoding="utf-8")
 
 
 def _run_file_config_benchmark(
@@ -295,7 +349,9 @@ def _run_single_parse(
             doc_type=file_doc_type,
             indexing_cleanup=bool(config.get("indexing_cleanup", False)),
         )
-        _persist_parse_outputs(out_file=out_file, raw_text=raw_text, full_text=full_text)
+        _persist_parse_outputs(
+            out_file=out_file, raw_text=raw_text, full_text=full_text, pages=pages
+        )
 
         record = _build_record_from_extracted_text(
             file_path=file_path,
@@ -365,6 +421,15 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Drop Docling text blocks whose bbox contains no real PDF words (ghost-box mitigation).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BENCHMARK_WORKERS,
+        help=(
+            f"Parallel PyMuPDF processes / LlamaParse threads (default: {BENCHMARK_WORKERS}). "
+            "Above 1, timings are measured under CPU contention."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -390,6 +455,7 @@ def _print_run_context(
     doc_type: str | None,
     allowed_filenames: set[str] | None,
     docling_validate_bboxes: bool,
+    workers: int,
 ) -> None:
     """Print top-level benchmark execution context."""
     print(f"[INFO] Running parser configs ({len(selected_configs)}): {', '.join(selected_configs)}")
@@ -397,6 +463,8 @@ def _print_run_context(
         print(f"[INFO] Filtering to doc_type='{doc_type}' ({len(allowed_filenames)} files)")
     if docling_validate_bboxes:
         print("[INFO] Docling ghost-box validation is ENABLED.")
+    if workers > 1:
+        print(f"[WARN] Running {workers} jobs in parallel: timings are taken under CPU contention.")
 
 
 def _run_enabled_benchmarks(
@@ -406,7 +474,8 @@ def _run_enabled_benchmarks(
     selected_configs: list[str],
     allowed_filenames: set[str] | None,
     docling_validate_bboxes: bool,
-) -> list[dict]:
+    workers: int,
+) -> Iterator[dict]:
     """Execute benchmark on the configured raw dataset."""
     return run_benchmark(
         input_folder=input_folder,
@@ -414,15 +483,27 @@ def _run_enabled_benchmarks(
         selected_configs=selected_configs,
         allowed_filenames=allowed_filenames,
         docling_validate_bboxes=docling_validate_bboxes,
+        workers=workers,
     )
 
 
-def _write_results_csv(results: list[dict]) -> None:
-    """Write benchmark records to the output CSV."""
+def _write_results_csv(results: Iterable[dict]) -> int:
+    """Stream benchmark records to the output CSV and return the number of rows written.
+
+    Rows are written in the order *results* yields them, which is job order for
+    run_benchmark. Each row is flushed as soon as it arrives, so memory stays
+    flat and partial results survive an interrupted run.
+    """
+    row_count = 0
     with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(results)
+        # Plain writer on pre-projected rows: skips DictWriter's per-row key checks
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for row in results:
+            writer.writerow([row.get(field, "") for field in FIELDNAMES])
+            f.flush()
+            row_count += 1
+    return row_count
 
 
 def main() -> None:
@@ -440,17 +521,19 @@ def main() -> None:
         doc_type=parsed.doc_type,
         allowed_filenames=allowed_filenames,
         docling_validate_bboxes=parsed.docling_validate_bboxes,
+        workers=parsed.workers,
     )
-    all_results = _run_enabled_benchmarks(
+    results = _run_enabled_benchmarks(
         input_folder=INPUT_FOLDER_RAW,
         skip_existing=skip_existing,
         selected_configs=selected_configs,
         allowed_filenames=allowed_filenames,
         docling_validate_bboxes=parsed.docling_validate_bboxes,
+        workers=parsed.workers,
     )
-    _write_results_csv(all_results)
+    row_count = _write_results_csv(results)
 
-    print(f"\nBenchmark complete → {len(all_results)} rows written to {OUTPUT_CSV}")
+    print(f"\nBenchmark complete → {row_count} rows written to {OUTPUT_CSV}")
 
 
 if __name__ == "__main__":
@@ -12,20 +12,39 @@ TITLE_SCAN_LINES = 10
 # Limit author detection scan to early text where author credits usually appear.
 AUTHOR_CHUNK_CHARS = 2000
 
+# Patterns compiled once at import, reused for every file and config.
+_DOI_RE = re.compile(r"10\.\d{4,}/\S+")
+_ABSTRACT_RE = re.compile(r"\babstract\b", re.IGNORECASE)
+_REFERENCES_RE = re.compile(r"\breferences\b", re.IGNORECASE)
+_AUTHOR_RE = re.compile(
+    r"[A-Z][a-z]+\s+[A-Z][a-z]+"  # Firstname Lastname
+    r"|(?:authors?|by)\s*:"  # Explicit label for authors
+    r"|[A-Z]\.\s*[A-Z][a-z]+"  # J. Smith
+)
+
 
 def detect_doi(text: str) -> str:
     """Search for a DOI pattern (e.g. 10.1234/...) anywhere in extracted text."""
-    return "found" if re.search(r"10\.\d{4,}/\S+", text) else "not_found"
+    return "found" if _DOI_RE.search(text) else "not_found"
 
 
 def detect_abstract(text: str) -> str:
     """Check whether the word 'Abstract' appears as a section heading."""
-    return "found" if re.search(r"\babstract\b", text, re.IGNORECASE) else "not_found"
+    return "found" if _ABSTRACT_RE.search(text) else "not_found"
 
 
 def detect_references(text: str) -> str:
     """Check whether a 'References' section exists (typically at the end)."""
-    return "found" if re.search(r"\breferences\b", text, re.IGNORECASE) else "not_found"
+    return "found" if _REFERENCES_RE.search(text) else "not_found"
+
+
+def detect_global_metadata(text: str) -> dict[str, str]:
+    """Detect DOI, abstract and references in the full extracted text."""
+    return {
+        "has_doi": detect_doi(text),
+        "has_abstract": detect_abstract(text),
+        "has_references": detect_references(text),
+    }
 
 
 def detect_title(first_chunk: str) -> str:
@@ -40,19 +59,24 @@ def detect_title(first_chunk: str) -> str:
 def detect_authors(first_chunk: str) -> str:
     """Heuristic: look for name-like patterns or 'Author(s):' in the first N chars."""
     snippet = first_chunk[:AUTHOR_CHUNK_CHARS]
-    patterns = [
-        r"[A-Z][a-z]+\s+[A-Z][a-z]+",  # Firstname Lastname
-        r"(?:authors?|by)\s*:",  # Explicit label for authors
-        r"[A-Z]\.\s*[A-Z][a-z]+",  # J. Smith
-    ]
-    for pat in patterns:
-        if re.search(pat, snippet):
-            return "found"
-    return "not_found"
+    return "found" if _AUTHOR_RE.search(snippet) else "not_found"
+
+
+METADATA_FIELDS = ("has_doi", "has_abstract", "has_references", "has_title", "has_authors")
 
 
 def compute_metadata_score(record: dict) -> int:
     """Count how many of the 5 metadata fields were detected."""
-    fields = ["has_doi", "has_abstract", "has_references", "has_title", "has_authors"]
-    return sum(1 for f in fields if record.get(f) == "found")
+    return sum(1 for f in METADATA_FIELDS if record.get(f) == "found")
+
+
+def detect_all(full_text: str, first_chunk: str) -> dict[str, str | int]:
+    """Run every detector once and return the 5 metadata fields plus ``metadata_score``."""
+    detected: dict[str, str | int] = {
+        **detect_global_metadata(full_text),
+        "has_title": detect_title(first_chunk),
+        "has_authors": detect_authors(first_chunk),
+    }
+    detected["metadata_score"] = compute_metadata_score(detected)
+    return detected
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 _PARSING_ROOT = Path(__file__).resolve().parent.parent
@@ -9,9 +10,14 @@ EXTRACTED_TEXT_DIR = _PARSING_ROOT / "output" / "extracted_texts"
 RAW_DATASET_VARIANT = "raw"
 
 
+def structured_dir(config_name: str, dataset_variant: str) -> Path:
+    """Return the canonical structured output directory of a config."""
+    return EXTRACTED_TEXT_DIR / dataset_variant / config_name
+
+
 def structured_path(stem: str, config_name: str, dataset_variant: str) -> Path:
     """Return the canonical structured output path."""
-    return EXTRACTED_TEXT_DIR / dataset_variant / config_name / f"{stem}.txt"
+    return structured_dir(config_name, dataset_variant) / f"{stem}.txt"
 
 
 def resolve_existing_path(
@@ -29,3 +35,15 @@ def resolve_existing_path(
 
     return None
 
+
+def list_existing_stems(config_name: str) -> set[str]:
+    """Stems with a canonical raw extracted text for *config_name*, from one directory scan."""
+    config_dir = structured_dir(config_name, RAW_DATASET_VARIANT)
+    if not config_dir.is_dir():
+        return set()
+    with os.scandir(config_dir) as entries:
+        return {
+            entry.name[: -len(".txt")]
+            for entry in entries
+            if entry.name.endswith(".txt") and entry.is_file()
+        }
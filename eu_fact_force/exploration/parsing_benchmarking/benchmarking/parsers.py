@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import io
+from functools import lru_cache
 from pathlib import Path
 
 import fitz as PyMuPDF
-from docling.document_converter import DocumentConverter
 from hierarchical.postprocessor import ResultPostprocessor
 
+from eu_fact_force.ingestion.parsing.docling_parser import get_converter
 from eu_fact_force.ingestion.parsing.docling_postprocess import render_docling_output
 
 
+@lru_cache(maxsize=None)
+def _get_llamaparse(result_type: str, api_key: str | None):
+    """One LlamaParse client per result type, shared by all files (and benchmark threads)."""
+    from llama_index.readers.llama_parse import LlamaParse
+
+    return LlamaParse(api_key=api_key, result_type=result_type)
+
+
 def parse_llamaparse(file_path: Path, result_type: str, api_key: str | None):
     """Parse a PDF with LlamaParse and return (full_text, first_chunk, pages, num_docs)."""
     from llama_index.core import SimpleDirectoryReader
-    from llama_index.readers.llama_parse import LlamaParse
 
-    parser = LlamaParse(api_key=api_key, result_type=result_type)
+    parser = _get_llamaparse(result_type, api_key)
     reader = SimpleDirectoryReader(
         input_files=[str(file_path)],
         file_extractor={".pdf": parser},
@@ -35,15 +44,25 @@ def parse_llamaparse(file_path: Path, result_type: str, api_key: str | None):
 
 
 def parse_pymupdf(file_path: Path):
-    """Parse a PDF with PyMuPDF and return (full_text, first_chunk, pages, num_docs)."""
-    doc = PyMuPDF.open(str(file_path))
-    page_texts = [doc[i].get_text() for i in range(len(doc))]
-    pages = len(doc)
-    doc.close()
-
-    full_text = "\n".join(page_texts)
-    first_chunk = page_texts[0] if page_texts else ""
-    return full_text, first_chunk, pages, pages  # one "document" per page
+    """Parse a PDF with PyMuPDF and return (full_text, first_chunk, pages, num_docs).
+
+    Pages are read sequentially on purpose: MuPDF is not thread-safe and PyMuPDF
+    holds the GIL during extraction, so parallelism happens per file in processes.
+    """
+    # Stream pages into one buffer instead of keeping every page string alive
+    buffer = io.StringIO()
+    first_chunk = ""
+    with PyMuPDF.open(str(file_path)) as doc:
+        pages = len(doc)
+        for i, page in enumerate(doc):
+            text = page.get_text()
+            if i == 0:
+                first_chunk = text
+            else:
+                buffer.write("\n")
+            buffer.write(text)
+
+    return buffer.getvalue(), first_chunk, pages, pages  # one "document" per page
 
 
 def parse_docling(
@@ -53,7 +72,7 @@ def parse_docling(
     validate_text_bboxes: bool = True,
 ):
     """Parse a PDF with Docling and return (full_text, pages, num_docs)."""
-    parser = DocumentConverter()
+    parser = get_converter()
     result = parser.convert(file_path)
     if postprocess is True:
         ResultPostprocessor(result).process()
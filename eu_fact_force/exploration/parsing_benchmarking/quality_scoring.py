@@ -15,12 +15,16 @@ Output: output/extraction_scores.csv
 
 import csv
 import argparse
+import heapq
+import os
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from eu_fact_force.exploration.parsing_benchmarking.benchmarking.extracted_text_store import (
     RAW_DATASET_VARIANT,
-    resolve_existing_path,
+    list_existing_stems,
     structured_path,
 )
 from .scoring.content import (
@@ -37,7 +41,7 @@ from .scoring.metadata import (
 from .scoring.similarity import score_reference_text
 from eu_fact_force.exploration.parsing_benchmarking.scoring.utils import (
     FOUND,
-    find_reference_text_path,
+    build_reference_text_index,
 )
 from eu_fact_force.exploration.parsing_benchmarking.benchmarking.ground_truth_loader import (
     get_ground_truth_documents,
@@ -58,6 +62,12 @@ OUTPUT_CSV = _PARSING_ROOT / "output" / "extraction_scores.csv"
 
 MISSING_FILE = "missing_file"
 
+# Rows are written as they are scored; a large buffer keeps writes to a few syscalls
+CSV_BUFFER_SIZE = 1 << 20
+
+# Documents are independent and scoring is CPU-bound: one process per core
+SCORING_WORKERS = max(1, os.cpu_count() or 1)
+
 PARSER_CONFIGS = get_scoring_configs()
 PARSER_CONFIG_PROFILES: dict[str, list[str]] = get_scoring_profiles()
 
@@ -212,18 +222,9 @@ def _has_metadata_annotations(gt: dict) -> bool:
 
 
 def _resolve_extracted_text_path(filename: str, config: str) -> Path:
-    """Resolve extracted text path from the raw structured layout."""
-    stem = Path(filename).stem
-    resolved = resolve_existing_path(
-        stem=stem,
-        config_name=config,
-    )
-    if resolved is not None:
-        return resolved
-
-    # Fallback canonical location to keep skip message deterministic.
+    """Canonical extracted text path in the raw structured layout."""
     return structured_path(
-        stem=stem,
+        stem=Path(filename).stem,
         config_name=config,
         dataset_variant=RAW_DATASET_VARIANT,
     )
@@ -279,6 +280,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to write per-row timing diagnostics as CSV.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCORING_WORKERS,
+        help=f"Number of documents scored in parallel processes (default: {SCORING_WORKERS}).",
+    )
     return parser.parse_args()
 
 
@@ -313,11 +320,13 @@ def _score_one_document_config(
     gt: dict,
     config: str,
     args: argparse.Namespace,
+    ref_path: Path | None,
+    text_exists: bool,
 ) -> tuple[dict, dict[str, float | str] | None]:
     """Score one (document, parser_config) pair and return record + timing row."""
     text_file = _resolve_extracted_text_path(filename=filename, config=config)
     record = _empty_record(filename, config, gt["doc_type"])
-    if not text_file.exists():
+    if not text_exists:
         print(f"  [SKIP] {text_file} not found")
         return record, None
 
@@ -347,7 +356,6 @@ def _score_one_document_config(
             gt=gt,
         )
 
-    ref_path = find_reference_text_path(Path(filename).stem, GROUND_TRUTH_TEXT_DIR)
     similarity_time_ms = 0.0
     if ref_path is not None and not args.skip_similarity:
         similarity_time_ms = _run_scoring_step_and_time_ms(
@@ -390,6 +398,39 @@ def _score_one_document_config(
     return record, timing_row
 
 
+def _score_document(
+    filename: str,
+    gt: dict,
+    parser_configs: list[str],
+    args: argparse.Namespace,
+    ref_path: Path | None,
+    configs_with_text: set[str],
+) -> list[tuple[dict, dict[str, float | str] | None]]:
+    """Score every parser config of one document in the same worker (reference caches stay warm)."""
+    return [
+        _score_one_document_config(
+            filename=filename,
+            gt=gt,
+            config=config,
+            args=args,
+            ref_path=ref_path,
+            text_exists=config in configs_with_text,
+        )
+        for config in parser_configs
+    ]
+
+
+def _document_inputs(
+    filename: str,
+    ref_index: dict[str, Path],
+    existing_stems: dict[str, set[str]],
+) -> tuple[Path | None, set[str]]:
+    """Reference text path and the parser configs with an extracted text for one document."""
+    stem = Path(filename).stem
+    configs_with_text = {config for config, stems in existing_stems.items() if stem in stems}
+    return ref_index.get(stem), configs_with_text
+
+
 def _run_scoring_step_and_time_ms(
     *,
     record: dict,
@@ -425,12 +466,19 @@ def _log_row_timing(
     )
 
 
-def _write_results_csv(results: list[dict]) -> None:
-    """Write scored rows to the default output CSV."""
-    with open(OUTPUT_CSV, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(results)
+def _write_results_csv(results: Iterable[dict]) -> int:
+    """Stream scored rows to the default output CSV; returns the number of rows written."""
+    row_count = 0
+    with open(
+        OUTPUT_CSV, mode="w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+    ) as f:
+        # Plain writer on pre-projected rows: skips DictWriter's per-row key checks
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        for row in results:
+            writer.writerow([row.get(field, "") for field in CSV_FIELDNAMES])
+            row_count += 1
+    return row_count
 
 
 def _write_timing_csv(timing_output_csv: str | None, timing_rows: list[dict[str, float | str]]) -> None:
@@ -440,9 +488,9 @@ def _write_timing_csv(timing_output_csv: str | None, timing_rows: list[dict[str,
     timing_path = Path(timing_output_csv)
     timing_path.parent.mkdir(parents=True, exist_ok=True)
     with open(timing_path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TIMING_FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(timing_rows)
+        writer = csv.writer(f)
+        writer.writerow(TIMING_FIELDNAMES)
+        writer.writerows([row.get(field, "") for field in TIMING_FIELDNAMES] for row in timing_rows)
 
 
 def main():
@@ -455,92 +503,172 @@ def main():
     print(f"[INFO] Scoring parser configs ({len(parser_configs)}): {', '.join(parser_configs)}")
     if args.skip_similarity:
         print("[INFO] Similarity scoring disabled (--skip-similarity).")
-    results: list[dict] = []
     timing_rows: list[dict[str, float | str]] = []
+    # Only running per-config sums are kept for the summaries, not the scored rows
+    summaries = _new_summaries()
 
-    for filename, gt in gt_docs.items():
-        for config in parser_configs:
-            record, timing_row = _score_one_document_config(
-                filename=filename,
-                gt=gt,
-                config=config,
-                args=args,
-            )
-            results.append(record)
+    def records() -> Iterator[dict]:
+        for record, timing_row in _iter_scored(gt_docs, parser_configs, args):
+            for summary in summaries.values():
+                summary.add(record)
             if timing_row is not None:
                 timing_rows.append(timing_row)
+            yield record
 
-    _write_results_csv(results)
+    row_count = _write_results_csv(records())
     _write_timing_csv(args.timing_output_csv, timing_rows)
 
-    print(f"\nQuality scoring complete → {len(results)} rows written to {OUTPUT_CSV}")
+    print(f"\nQuality scoring complete → {row_count} rows written to {OUTPUT_CSV}")
     if args.log_timing:
         _print_timing_summary(timing_rows)
-    _print_summaries(results, parser_configs)
+    _print_summaries(summaries, parser_configs)
+
+
+def _iter_scored(
+    gt_docs: dict[str, dict],
+    parser_configs: list[str],
+    args: argparse.Namespace,
+) -> Iterator[tuple[dict, dict[str, float | str] | None]]:
+    """Yield (record, timing_row) pairs in document/config order as documents finish."""
+    # One directory scan each instead of per-row existence checks
+    ref_index = build_reference_text_index(GROUND_TRUTH_TEXT_DIR)
+    existing_stems = {config: list_existing_stems(config) for config in parser_configs}
+
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            # Submission order is kept so the CSV rows stay in document/config order
+            futures = [
+                pool.submit(
+                    _score_document,
+                    filename,
+                    gt,
+                    parser_configs,
+                    args,
+                    *_document_inputs(filename, ref_index, existing_stems),
+                )
+                for filename, gt in gt_docs.items()
+            ]
+            for future in futures:
+                yield from future.result()
+    else:
+        for filename, gt in gt_docs.items():
+            yield from _score_document(
+                filename,
+                gt,
+                parser_configs,
+                args,
+                *_document_inputs(filename, ref_index, existing_stems),
+            )
 
 
 # =========================
 # SUMMARY OUTPUT
 # =========================
 
-def _avg(rows: list[dict], field: str) -> float | None:
-    """Average of *field* across rows, skipping None values."""
-    valid = [r[field] for r in rows if r.get(field) is not None]
-    return sum(valid) / len(valid) if valid else None
+class _GroupAverages:
+    """
+    Per-config averages of *fields* over rows where *require* is not None,
+    skipping None values. Rows are fed one at a time into running (sum, count).
+    """
+
+    def __init__(self, require: str, fields: tuple[str, ...]):
+        self.require = require
+        self.fields = fields
+        self._accumulators: dict[str, dict[str, list[float]]] = {}
 
+    def add(self, record: dict) -> None:
+        if record.get(self.require) is None:
+            return
+        acc = self._accumulators.setdefault(
+            record["parser_config"], {f: [0.0, 0] for f in self.fields}
+        )
+        for field in self.fields:
+            value = record.get(field)
+            if value is not None:
+                acc[field][0] += value
+                acc[field][1] += 1
+
+    def averages(self) -> dict[str, dict[str, float | None]]:
+        return {
+            config: {
+                field: (total / count if count else None) for field, (total, count) in acc.items()
+            }
+            for config, acc in self._accumulators.items()
+        }
 
-def _rows_for(results: list[dict], config: str, require: str) -> list[dict]:
-    """Filter results for a config where *require* field is not None."""
-    return [
-        r for r in results
-        if r["parser_config"] == config and r.get(require) is not None
-    ]
+
+def _new_summaries() -> dict[str, _GroupAverages]:
+    return {
+        "structural": _GroupAverages(
+            "structural_quality", ("structural_quality", "fragmentation_ratio")
+        ),
+        "similarity": _GroupAverages(
+            "text_similarity",
+            ("text_similarity", "content_recall", "content_precision", "order_score"),
+        ),
+        "metadata": _GroupAverages(
+            "meta_accuracy_score",
+            (
+                "meta_accuracy_score",
+                "meta_title_accuracy",
+                "meta_authors_recall",
+                "meta_doi_accuracy",
+                "meta_abstract_accuracy",
+            ),
+        ),
+    }
 
 
-def _print_summaries(results: list[dict], parser_configs: list[str]):
+def _print_summaries(summaries: dict[str, _GroupAverages], parser_configs: list[str]):
     """Print per-config summary tables to stdout."""
-    _print_structural_summary(results, parser_configs)
-    _print_similarity_summary(results, parser_configs)
-    _print_metadata_summary(results, parser_configs)
+    _print_structural_summary(summaries["structural"].averages(), parser_configs)
+    _print_similarity_summary(summaries["similarity"].averages(), parser_configs)
+    _print_metadata_summary(summaries["metadata"].averages(), parser_configs)
 
 
-def _print_structural_summary(results: list[dict], parser_configs: list[str]):
+def _print_structural_summary(
+    averages: dict[str, dict[str, float | None]], parser_configs: list[str]
+):
     print("\n=== Structural Quality Summary ===")
     for config in parser_configs:
-        rows = _rows_for(results, config, "structural_quality")
-        if rows:
-            print(f"  {config}: structural_quality={_avg(rows, 'structural_quality'):.1f}/100"
-                  f"  frag={_avg(rows, 'fragmentation_ratio'):.3f}")
+        avg = averages.get(config)
+        if avg:
+            print(f"  {config}: structural_quality={avg['structural_quality']:.1f}/100"
+                  f"  frag={avg['fragmentation_ratio']:.3f}")
 
 
-def _print_similarity_summary(results: list[dict], parser_configs: list[str]):
-    if not any(r.get("text_similarity") is not None for r in results):
+def _print_similarity_summary(
+    averages: dict[str, dict[str, float | None]], parser_configs: list[str]
+):
+    if not averages:
         return
     print("\n=== Reference-Text Similarity (documents with ground truth text) ===")
     for config in parser_configs:
-        rows = _rows_for(results, config, "text_similarity")
-        if rows:
-            order = _avg(rows, "order_score")
+        avg = averages.get(config)
+        if avg:
+            order = avg["order_score"]
             order_str = f"  order={order:.3f}" if order is not None else ""
-            print(f"  {config}: similarity={_avg(rows, 'text_similarity'):.3f}"
-                  f"  recall={_avg(rows, 'content_recall'):.3f}"
-                  f"  precision={_avg(rows, 'content_precision'):.3f}{order_str}")
+            print(f"  {config}: similarity={avg['text_similarity']:.3f}"
+                  f"  recall={avg['content_recall']:.3f}"
+                  f"  precision={avg['content_precision']:.3f}{order_str}")
 
 
-def _print_metadata_summary(results: list[dict], parser_configs: list[str]):
-    if not any(r.get("meta_accuracy_score") is not None for r in results):
+def _print_metadata_summary(
+    averages: dict[str, dict[str, float | None]], parser_configs: list[str]
+):
+    if not averages:
         return
     print("\n=== Metadata Accuracy Summary ===")
     for config in parser_configs:
-        rows = _rows_for(results, config, "meta_accuracy_score")
-        if rows:
-            doi = _avg(rows, "meta_doi_accuracy")
-            abstract = _avg(rows, "meta_abstract_accuracy")
+        avg = averages.get(config)
+        if avg:
+            doi = avg["meta_doi_accuracy"]
+            abstract = avg["meta_abstract_accuracy"]
             doi_str = f"  doi={doi:.3f}" if doi is not None else ""
             abs_str = f"  abstract={abstract:.3f}" if abstract is not None else ""
-            print(f"  {config}: score={_avg(rows, 'meta_accuracy_score'):.1f}/100"
-                  f"  title={_avg(rows, 'meta_title_accuracy'):.3f}"
-                  f"  authors={_avg(rows, 'meta_authors_recall'):.3f}{doi_str}{abs_str}")
+            print(f"  {config}: score={avg['meta_accuracy_score']:.1f}/100"
+                  f"  title={avg['meta_title_accuracy']:.3f}"
+                  f"  authors={avg['meta_authors_recall']:.3f}{doi_str}{abs_str}")
 
 
 def _print_timing_summary(timing_rows: list[dict[str, float | str]], top_n: int = 10):
@@ -550,25 +678,30 @@ def _print_timing_summary(timing_rows: list[dict[str, float | str]], top_n: int
 
     print("\n=== Timing Summary ===")
 
-    def _avg(field: str) -> float:
-        return sum(float(r[field]) for r in timing_rows) / len(timing_rows)
+    # Timing values are stored as floats when rows are built: no re-parsing here
+    fields = ("total_ms", "content_ms", "structural_ms", "metadata_ms", "similarity_ms")
+    totals = dict.fromkeys(fields, 0.0)
+    for r in timing_rows:
+        for field in fields:
+            totals[field] += r[field]
+    avg = {field: total / len(timing_rows) for field, total in totals.items()}
 
     print(
         "  avg(ms): "
-        f"total={_avg('total_ms'):.1f} "
-        f"content={_avg('content_ms'):.1f} "
-        f"structural={_avg('structural_ms'):.1f} "
-        f"metadata={_avg('metadata_ms'):.1f} "
-        f"similarity={_avg('similarity_ms'):.1f}"
+        f"total={avg['total_ms']:.1f} "
+        f"content={avg['content_ms']:.1f} "
+        f"structural={avg['structural_ms']:.1f} "
+        f"metadata={avg['metadata_ms']:.1f} "
+        f"similarity={avg['similarity_ms']:.1f}"
     )
 
-    slowest = sorted(timing_rows, key=lambda r: float(r["total_ms"]), reverse=True)[:top_n]
+    slowest = heapq.nlargest(top_n, timing_rows, key=lambda r: r["total_ms"])
     print(f"  slowest {len(slowest)} rows:")
     for row in slowest:
         print(
             f"    - {row['filename']} | {row['parser_config']} | "
-            f"total={float(row['total_ms']):.1f}ms "
-            f"(sim={float(row['similarity_ms']):.1f}ms, chars={int(float(row['chars']))})"
+            f"total={row['total_ms']:.1f}ms "
+            f"(sim={row['similarity_ms']:.1f}ms, chars={int(row['chars'])})"
         )
 
 
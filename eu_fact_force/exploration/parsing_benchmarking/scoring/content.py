@@ -8,7 +8,7 @@ Uses ground_truth.json annotations to evaluate:
 """
 
 import re
-from collections import Counter
+from bisect import bisect_left, insort
 
 from .utils import (
     contains_fuzzy, normalize_for_dedup,
@@ -40,6 +40,12 @@ WORST_DUPLICATE_RATIO = 0.20
 # Section order requires at least this many matched positions
 MIN_SECTION_POSITIONS = 2
 
+# Patterns compiled once at import, reused for every (document, config) pair
+_REFERENCES_RE = re.compile(r"\b(?:references|bibliography)\b", re.IGNORECASE)
+_LIST_ITEM_RE = re.compile(r"^[-*•]\s|^\d+[\.\)]\s")
+_HEADING_RE = re.compile(r"^#{1,3}\s+(.+)", re.MULTILINE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
 
 # =========================
 # CONTENT-PRESENCE SCORING
@@ -61,6 +67,9 @@ def score_authors(full_text: str, expected_authors: list[str]) -> tuple[str, flo
         best_ratio = max(best_ratio, ratio)
         if found:
             any_found = True
+            # An exact hit is the best ratio any author can reach: stop searching
+            if best_ratio >= 1.0:
+                break
     return (FOUND if any_found else NOT_FOUND), best_ratio
 
 
@@ -81,11 +90,7 @@ def score_abstract(full_text: str, expected_first_sentence: str | None) -> tuple
 
 def score_references(full_text: str) -> str:
     """Check if a references section is detectable."""
-    if re.search(r"\breferences\b", full_text, re.IGNORECASE):
-        return FOUND
-    if re.search(r"\bbibliography\b", full_text, re.IGNORECASE):
-        return FOUND
-    return NOT_FOUND
+    return FOUND if _REFERENCES_RE.search(full_text) else NOT_FOUND
 
 
 def score_key_passage(full_text: str, expected_passage: str) -> tuple[str, float]:
@@ -106,38 +111,39 @@ def score_fragmentation(full_text: str) -> float:
 
     Returns fragmentation_ratio (0.0 = clean, higher = more fragmented).
     """
-    lines = full_text.splitlines()
-    total = len(lines)
+    # Strip every line once; blank/non-blank counting happens in the same pass
+    stripped_lines = [line.strip() for line in full_text.splitlines()]
+    total = len(stripped_lines)
     if total == 0:
         return 0.0
 
     frag_count = 0
+    non_blank = 0
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    for i, stripped in enumerate(stripped_lines):
         if not stripped:
             continue
+        non_blank += 1
 
         # Hyphenated line break: line ends with letter-hyphen, next line starts lowercase
         if (
             stripped.endswith("-")
             and len(stripped) > MIN_HYPHENATED_LINE_CHARS
             and i + 1 < total
-            and lines[i + 1].strip()
-            and lines[i + 1].strip()[0].islower()
+            and stripped_lines[i + 1]
+            and stripped_lines[i + 1][0].islower()
         ):
             frag_count += 1
             continue
 
-        # Orphan line: short, not a heading/list/blank
-        if len(stripped) < ORPHAN_LINE_MAX_CHARS:
-            is_heading = stripped.startswith("#")
-            is_list = bool(re.match(r"^[-*•]\s|^\d+[\.\)]\s", stripped))
-            is_blank_like = len(stripped) < BLANK_LIKE_MAX_CHARS
-            if not is_heading and not is_list and not is_blank_like:
-                frag_count += 1
+        # Orphan line: short, not a heading/list/blank (list regex only if still needed)
+        if (
+            BLANK_LIKE_MAX_CHARS <= len(stripped) < ORPHAN_LINE_MAX_CHARS
+            and not stripped.startswith("#")
+            and not _LIST_ITEM_RE.match(stripped)
+        ):
+            frag_count += 1
 
-    non_blank = sum(1 for line in lines if line.strip())
     return round(frag_count / max(1, non_blank), 4)
 
 
@@ -154,31 +160,43 @@ def score_section_order(full_text: str, sections_in_order: list[str] | None) ->
     if not sections_in_order or len(sections_in_order) < MIN_SECTION_POSITIONS:
         return None
 
-    heading_pattern = re.compile(r"^#{1,3}\s+(.+)", re.MULTILINE)
-    headings_found = [m.group(1).strip().lower() for m in heading_pattern.finditer(full_text)]
+    headings_found = [m.group(1).strip().lower() for m in _HEADING_RE.finditer(full_text)]
 
     if not headings_found:
         return None
 
-    expected_lower = [s.lower() for s in sections_in_order]
+    # Headings are single lines, so one search of the joined text rules out
+    # "expected in heading" for every heading at once
+    heading_haystack = "\n".join(headings_found)
+    first_exact: dict[str, int] = {}
+    for idx, found_heading in enumerate(headings_found):
+        first_exact.setdefault(found_heading, idx)
+
     positions = []
-    for expected in expected_lower:
-        for idx, found_heading in enumerate(headings_found):
-            if expected in found_heading or found_heading in expected:
+    for expected in (s.lower() for s in sections_in_order):
+        # An exact heading is a match, so only earlier headings need the substring tests
+        stop = first_exact.get(expected, len(headings_found))
+        expected_inside = expected in heading_haystack
+        for idx in range(stop):
+            found_heading = headings_found[idx]
+            if (expected_inside and expected in found_heading) or found_heading in expected:
                 positions.append(idx)
                 break
+        else:
+            if stop < len(headings_found):
+                positions.append(stop)
 
     if len(positions) < MIN_SECTION_POSITIONS:
         return None
 
-    # Count pairs in correct relative order (Kendall-style concordance)
+    # Count pairs in correct relative order (Kendall-style concordance): each
+    # position is concordant with the strictly smaller positions seen before it
     correct = 0
-    total_pairs = 0
-    for i in range(len(positions)):
-        for j in range(i + 1, len(positions)):
-            total_pairs += 1
-            if positions[i] < positions[j]:
-                correct += 1
+    seen: list[int] = []
+    for position in positions:
+        correct += bisect_left(seen, position)
+        insort(seen, position)
+    total_pairs = len(positions) * (len(positions) - 1) // 2
 
     return round(correct / total_pairs, 4) if total_pairs else None
 
@@ -190,16 +208,20 @@ def score_duplicate_content(full_text: str) -> float:
     Returns duplicate_ratio: fraction of paragraphs that are duplicates.
     0.0 = no duplicates, higher = more redundancy.
     """
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", full_text) if p.strip()]
-    paragraphs = [p for p in paragraphs if len(p) >= MIN_PARAGRAPH_CHARS]
+    paragraphs = [
+        stripped
+        for p in _PARAGRAPH_SPLIT_RE.split(full_text)
+        if len(stripped := p.strip()) >= MIN_PARAGRAPH_CHARS
+    ]
 
     if len(paragraphs) < 2:
         return 0.0
 
-    normed = [normalize_for_dedup(p) for p in paragraphs]
-    counts: Counter = Counter(normed)
+    # Only 64-bit hashes of the normalised paragraphs are kept, not the strings:
+    # collisions are negligible and hash() is stable within one call
+    distinct = len({hash(normalize_for_dedup(p)) for p in paragraphs})
 
-    duplicate_count = sum(count - 1 for count in counts.values() if count > 1)
+    duplicate_count = len(paragraphs) - distinct
 
     return round(duplicate_count / len(paragraphs), 4)
 
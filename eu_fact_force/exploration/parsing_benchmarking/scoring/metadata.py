@@ -7,8 +7,9 @@ source, abstract, keywords).
 """
 
 import re
+from functools import lru_cache
 
-from .utils import contains_fuzzy, METADATA_SEARCH_CHARS
+from .utils import contains_fuzzy, lowered, METADATA_SEARCH_CHARS
 
 # Fuzzy threshold for author and keyword matching
 FUZZY_MATCH_THRESHOLD = 0.70
@@ -16,6 +17,11 @@ FUZZY_MATCH_THRESHOLD = 0.70
 # Year is always the first 4 characters of a date string (e.g. "2023-05-14")
 YEAR_LENGTH = 4
 
+# Ground-truth keyword strings are re-parsed for every parser config otherwise
+KEYWORDS_CACHE_SIZE = 256
+
+_KEYWORD_SEPARATOR_RE = re.compile(r"[,|;]")
+
 # Metadata accuracy weights (among applicable fields).
 # Fields with None are excluded and weights redistributed proportionally.
 _ACCURACY_WEIGHTS: dict[str, int] = {
@@ -29,14 +35,17 @@ _ACCURACY_WEIGHTS: dict[str, int] = {
 }
 
 
-def _normalize_keywords(raw: str) -> set[str]:
+@lru_cache(maxsize=KEYWORDS_CACHE_SIZE)
+def _normalize_keywords(raw: str) -> frozenset[str]:
     """
     Normalise a keyword string by splitting on common separators
     (comma, pipe, semicolon) and returning a set of lowercased,
     trimmed tokens.
+
+    Cached: the same ground-truth keywords are scored for every parser config.
     """
-    tokens = re.split(r"[,|;]", raw)
-    return {t.strip().lower() for t in tokens if t.strip()}
+    tokens = _KEYWORD_SEPARATOR_RE.split(raw)
+    return frozenset(t.strip().lower() for t in tokens if t.strip())
 
 
 def score_title_accuracy(full_text: str, expected_title: str) -> float:
@@ -137,7 +146,8 @@ def score_keywords_accuracy(
     if not expected_set:
         return None, None
 
-    text_lower = full_text.lower()
+    # Shared with contains_fuzzy below: the body is lowercased once per document
+    text_lower = lowered(full_text)
     found_count = 0
     ratios = []
     for kw in expected_set:
@@ -9,6 +9,7 @@ and use weighted scoring with a configurable threshold.
 """
 
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
 from .utils import (
@@ -20,6 +21,8 @@ from .utils import (
     strip_table_of_contents_section,
     split_sentences,
     best_match_ratio,
+    ratio_cannot_reach,
+    reusable_matcher,
     LENGTH_MISMATCH_RATIO,
 )
 
@@ -29,7 +32,12 @@ SENTENCE_MATCH_THRESHOLD = 0.80
 # Minimum matched sentences required for order scoring to be meaningful
 MIN_MATCHED_SENTENCES = 3
 
+# A reference text is scored against every parser config, and each text feeds
+# four metrics: keep recent prepared bodies/sentence lists instead of redoing them
+PREPARED_TEXT_CACHE_SIZE = 8
 
+
+@lru_cache(maxsize=PREPARED_TEXT_CACHE_SIZE)
 def _prepare_body(text: str) -> str:
     """Strip TOC/references/footnotes and normalize for similarity comparison."""
     body = strip_table_of_contents_section(text)
@@ -40,6 +48,25 @@ def _prepare_body(text: str) -> str:
     return normalize_for_similarity(body)
 
 
+@lru_cache(maxsize=PREPARED_TEXT_CACHE_SIZE)
+def _body_sentences(text: str) -> tuple[str, ...]:
+    """Sentences of the prepared body, shared (read-only) across metrics."""
+    return tuple(split_sentences(_prepare_body(text)))
+
+
+@lru_cache(maxsize=PREPARED_TEXT_CACHE_SIZE)
+def _body_sentence_lookup(text: str) -> tuple[frozenset[str], tuple[SequenceMatcher, ...]]:
+    """Exact-match set and one indexed matcher per body sentence, built once per text."""
+    sentences = _body_sentences(text)
+    return frozenset(sentences), tuple(reusable_matcher(s) for s in sentences)
+
+
+@lru_cache(maxsize=PREPARED_TEXT_CACHE_SIZE)
+def _read_reference(reference_path: Path) -> str:
+    """Ground-truth text, read once per document rather than once per parser config."""
+    return reference_path.read_text(encoding="utf-8")
+
+
 def compute_text_similarity(extracted: str, reference: str) -> float:
     """
     Compute overall text similarity between extracted and reference texts
@@ -65,19 +92,20 @@ def compute_content_recall(
 
     Returns a ratio between 0.0 and 1.0.
     """
-    ref_sentences = split_sentences(_prepare_body(reference))
+    ref_sentences = _body_sentences(reference)
     if not ref_sentences:
         return 1.0
 
-    ext_sentences = split_sentences(_prepare_body(extracted))
+    ext_sentences = _body_sentences(extracted)
     if not ext_sentences:
         return 0.0
 
-    ext_set = set(ext_sentences)
+    ext_set, ext_matchers = _body_sentence_lookup(extracted)
     total_score = sum(
         best
         for ref_s in ref_sentences
-        if (best := best_match_ratio(ref_s, ext_sentences, ext_set)) >= threshold
+        if (best := best_match_ratio(ref_s, ext_sentences, ext_set, threshold, ext_matchers))
+        >= threshold
     )
     return round(total_score / len(ref_sentences), 4)
 
@@ -95,19 +123,20 @@ def compute_content_precision(
 
     Returns a ratio between 0.0 (all noise) and 1.0 (all valid content).
     """
-    ext_sentences = split_sentences(_prepare_body(extracted))
+    ext_sentences = _body_sentences(extracted)
     if not ext_sentences:
         return 0.0
 
-    ref_sentences = split_sentences(_prepare_body(reference))
+    ref_sentences = _body_sentences(reference)
     if not ref_sentences:
         return 0.0
 
-    ref_set = set(ref_sentences)
+    ref_set, ref_matchers = _body_sentence_lookup(reference)
     total_score = sum(
         best
         for ext_s in ext_sentences
-        if (best := best_match_ratio(ext_s, ref_sentences, ref_set)) >= threshold
+        if (best := best_match_ratio(ext_s, ref_sentences, ref_set, threshold, ref_matchers))
+        >= threshold
     )
     return round(total_score / len(ext_sentences), 4)
 
@@ -130,13 +159,13 @@ def compute_order_score(
     Returns a score between 0.0 and 1.0, or None if fewer than
     MIN_MATCHED_SENTENCES sentences matched.
     """
-    ref_sentences = split_sentences(_prepare_body(reference))
-    ext_sentences = split_sentences(_prepare_body(extracted))
+    ref_sentences = _body_sentences(reference)
+    ext_sentences = _body_sentences(extracted)
 
     if len(ref_sentences) < MIN_MATCHED_SENTENCES or len(ext_sentences) < MIN_MATCHED_SENTENCES:
         return None
 
-    ext_set = set(ext_sentences)
+    ext_set, ext_matchers = _body_sentence_lookup(extracted)
     matched_positions: list[tuple[int, int]] = []
 
     for ref_idx, ref_s in enumerate(ref_sentences):
@@ -153,7 +182,12 @@ def compute_order_score(
             for ext_idx, ext_s in enumerate(ext_sentences):
                 if abs(len(ref_s) - len(ext_s)) > len(ref_s) * LENGTH_MISMATCH_RATIO:
                     continue
-                ratio = SequenceMatcher(None, ref_s, ext_s).ratio()
+                matcher = ext_matchers[ext_idx]
+                matcher.set_seq1(ref_s)
+                # Below threshold a candidate can never become the matched position
+                if ratio_cannot_reach(matcher, max(best_ratio, threshold)):
+                    continue
+                ratio = matcher.ratio()
                 if ratio > best_ratio:
                     best_ratio = ratio
                     best_pos = ext_idx
@@ -186,7 +220,7 @@ def score_reference_text(extracted_text: str, reference_path: Path) -> dict:
     Returns a dict with keys:
       text_similarity, content_recall, content_precision, order_score
     """
-    reference_text = reference_path.read_text(encoding="utf-8")
+    reference_text = _read_reference(reference_path)
 
     return {
         "text_similarity": compute_text_similarity(extracted_text, reference_text),
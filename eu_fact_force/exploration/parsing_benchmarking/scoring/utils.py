@@ -6,7 +6,9 @@ used across all scoring modules.
 """
 
 import re
+from collections.abc import Sequence
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
 from eu_fact_force.ingestion.parsing.text_cleaning import strip_legal_boilerplate_lines
@@ -27,6 +29,8 @@ SLIDING_WINDOW_STEP_DIVISOR = 4
 
 # Text search regions
 METADATA_SEARCH_CHARS = 5000
+# The same extracted text is fuzzy-searched for many needles (title, passages, keywords)
+LOWERED_TEXT_CACHE_SIZE = 8
 
 # Sentence splitting
 MIN_SENTENCE_CHARS = 30
@@ -41,11 +45,53 @@ TOC_SEARCH_END_FRACTION = 0.40
 CITATION_NOISE_SEARCH_START_FRACTION = 0.60
 REFERENCE_TEXT_EXTENSIONS = (".md", ".txt")
 
+# Patterns compiled once at import: normalization runs per text, the TOC and
+# reference heuristics per line
+_WHITESPACE_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+_FIGURE_PLACEHOLDER_RE = re.compile(r"\[Figure\s+\d+[^]]*\]")
+_HEADING_MARKER_RE = re.compile(r"^#{1,4}\s+", re.MULTILINE)
+_SUPERSCRIPT_DIGITS_RE = re.compile(r"[¹²³⁴⁵⁶⁷⁸⁹⁰]+")
+_SUPERSCRIPT_RANGE_RE = re.compile(r"[⁰-⁹–,]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_DOT_LEADER_RE = re.compile(r"\.{2,}")
+_PIPE_NUMBER_ROW_RE = re.compile(r"^\|?\s*\d{1,3}\s*\|")
+_TOC_PAGE_NUMBER_RE = re.compile(
+    r"(?i)^\s*(?:[-*]\s*)?(?:\d+(?:\.\d+)*\s+)?[^\n]{2,140}?\s+\d{1,4}\s*$"
+)
+_REFERENCE_MARKER_RE = re.compile(r"(?i)(https?://|doi\.org|arxiv:)")
+_NUMBERED_REFERENCE_RE = re.compile(r"^\s*(?:\[\d{1,3}\]|\d{1,3}[.)])\s+")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_TRAILING_YEAR_RE = re.compile(r"\(\d{4}\)\.?$")
+_BLANK_LINE_RUN_RE = re.compile(r"\n{3,}")
+
 
 # =========================
 # FUZZY MATCHING
 # =========================
 
+def reusable_matcher(b: str) -> SequenceMatcher:
+    """
+    SequenceMatcher indexed once on *b*; compare many needles against it
+    with ``set_seq1`` (only the b side is indexed, so it is not rebuilt).
+
+    autojunk is off: on texts over 200 chars its popular-character heuristic
+    skews ratios on repetitive content (boilerplate, reference lists).
+    """
+    return SequenceMatcher(None, "", b, autojunk=False)
+
+
+def ratio_cannot_reach(matcher: SequenceMatcher, floor: float) -> bool:
+    """True when the cheap upper bounds already prove ``matcher.ratio() < floor``."""
+    return matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor
+
+
+@lru_cache(maxsize=LOWERED_TEXT_CACHE_SIZE)
+def lowered(text: str) -> str:
+    """Lowercased *text*, cached so repeated lookups in one document lowercase it once."""
+    return text.lower()
+
+
 def contains_fuzzy(
     haystack: str,
     needle: str,
@@ -57,7 +103,7 @@ def contains_fuzzy(
     Uses a sliding-window approach for short needles.
     """
     needle_lower = needle.lower()
-    haystack_lower = haystack.lower()
+    haystack_lower = lowered(haystack)
 
     if needle_lower in haystack_lower:
         return True, 1.0
@@ -65,9 +111,12 @@ def contains_fuzzy(
     window = len(needle_lower)
     best = 0.0
     step = max(1, window // SLIDING_WINDOW_STEP_DIVISOR)
+    matcher = SequenceMatcher(None, needle_lower, "", autojunk=False)
     for i in range(0, len(haystack_lower) - window + 1, step):
-        chunk = haystack_lower[i : i + window]
-        ratio = SequenceMatcher(None, needle_lower, chunk).ratio()
+        matcher.set_seq2(haystack_lower[i : i + window])
+        if ratio_cannot_reach(matcher, best):
+            continue
+        ratio = matcher.ratio()
         if ratio > best:
             best = ratio
         if best >= EARLY_EXIT_RATIO:
@@ -82,8 +131,8 @@ def contains_fuzzy(
 
 def normalize_for_dedup(text: str) -> str:
     """Collapse whitespace, lowercase, digits->#  for dedup comparisons."""
-    t = re.sub(r"\s+", " ", text).strip().lower()
-    t = re.sub(r"\d+", "#", t)
+    t = _WHITESPACE_RE.sub(" ", text).strip().lower()
+    t = _DIGITS_RE.sub("#", t)
     return t
 
 
@@ -96,11 +145,11 @@ def normalize_for_similarity(text: str) -> str:
       - Collapse whitespace
       - Lowercase
     """
-    t = re.sub(r"\[Figure\s+\d+[^]]*\]", "", text)
-    t = re.sub(r"^#{1,4}\s+", "", t, flags=re.MULTILINE)
-    t = re.sub(r"[¹²³⁴⁵⁶⁷⁸⁹⁰]+", "", t)
-    t = re.sub(r"[⁰-⁹–,]+", "", t)
-    t = re.sub(r"\s+", " ", t).strip().lower()
+    t = _FIGURE_PLACEHOLDER_RE.sub("", text)
+    t = _HEADING_MARKER_RE.sub("", t)
+    t = _SUPERSCRIPT_DIGITS_RE.sub("", t)
+    t = _SUPERSCRIPT_RANGE_RE.sub("", t)
+    t = _WHITESPACE_RE.sub(" ", t).strip().lower()
     return t
 
 
@@ -144,7 +193,7 @@ def strip_references_section(text: str) -> str:
     kept_tail = [line for line, is_ref in zip(tail_lines, ref_flags) if not is_ref]
     cleaned_lines = lines[:start_idx] + kept_tail
     cleaned = "\n".join(cleaned_lines)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _BLANK_LINE_RUN_RE.sub("\n\n", cleaned)
     return cleaned.strip()
 
 
@@ -184,6 +233,26 @@ def find_reference_text_path(stem: str, gt_text_dir: Path) -> Path | None:
     return None
 
 
+def build_reference_text_index(gt_text_dir: Path) -> dict[str, Path]:
+    """
+    Map document stem -> ground-truth reference text path with one directory scan.
+    Same resolution as find_reference_text_path (earlier extensions win).
+    """
+    if not gt_text_dir.is_dir():
+        return {}
+    index: dict[str, Path] = {}
+    for path in gt_text_dir.iterdir():
+        if path.suffix not in REFERENCE_TEXT_EXTENSIONS or not path.is_file():
+            continue
+        current = index.get(path.stem)
+        if current is None or (
+            REFERENCE_TEXT_EXTENSIONS.index(path.suffix)
+            < REFERENCE_TEXT_EXTENSIONS.index(current.suffix)
+        ):
+            index[path.stem] = path
+    return index
+
+
 def strip_trailing_citation_noise(text: str) -> str:
     """
     Trim citation-heavy trailing tail when no explicit references header exists.
@@ -233,20 +302,17 @@ def _looks_like_toc_entry(line: str) -> bool:
         return False
 
     # Dot leaders are a strong signal of TOC rows.
-    if re.search(r"\.{2,}", stripped):
+    if _DOT_LEADER_RE.search(stripped):
         return True
 
     # Pipe-heavy rows are common in extracted TOC/table artifacts.
     if stripped.startswith("|") and stripped.count("|") >= 2:
         return True
-    if re.match(r"^\|?\s*\d{1,3}\s*\|", stripped):
+    if _PIPE_NUMBER_ROW_RE.match(stripped):
         return True
 
     # TOC entries often end with page numbers.
-    if re.match(
-        r"(?i)^\s*(?:[-*]\s*)?(?:\d+(?:\.\d+)*\s+)?[^\n]{2,140}?\s+\d{1,4}\s*$",
-        stripped,
-    ):
+    if _TOC_PAGE_NUMBER_RE.match(stripped):
         return True
 
     return False
@@ -261,18 +327,18 @@ def _looks_like_reference_line(line: str) -> bool:
         return False
 
     # Strong reference markers.
-    if re.search(r"(?i)(https?://|doi\.org|arxiv:)", stripped):
+    if _REFERENCE_MARKER_RE.search(stripped):
         return True
 
     # Typical numbered reference format: "12. Author ... (2020)."
-    if re.match(r"^\s*(?:\[\d{1,3}\]|\d{1,3}[.)])\s+", stripped):
-        if re.search(r"\b(19|20)\d{2}\b", stripped):
+    if _NUMBERED_REFERENCE_RE.match(stripped):
+        if _YEAR_RE.search(stripped):
             return True
         if "," in stripped and len(stripped) > 45:
             return True
 
     # Common citation style with year in parentheses and journal-like punctuation.
-    if re.search(r"\(\d{4}\)\.?$", stripped) and "," in stripped:
+    if _TRAILING_YEAR_RE.search(stripped) and "," in stripped:
         return True
 
     return False
@@ -367,23 +433,39 @@ def split_sentences(text: str) -> list[str]:
     Split normalized text into sentences.
     Returns sentences with length >= MIN_SENTENCE_CHARS (skip short fragments).
     """
-    raw = re.split(r"(?<=[.!?])\s+", text)
+    raw = _SENTENCE_SPLIT_RE.split(text)
     return [s.strip() for s in raw if len(s.strip()) >= MIN_SENTENCE_CHARS]
 
 
 def best_match_ratio(
     needle: str,
-    haystack_sentences: list[str],
-    haystack_set: set[str],
+    haystack_sentences: Sequence[str],
+    haystack_set: set[str] | frozenset[str],
+    min_ratio: float = 0.0,
+    haystack_matchers: Sequence[SequenceMatcher] | None = None,
 ) -> float:
-    """Find the best SequenceMatcher ratio for *needle* among *haystack_sentences*."""
+    """
+    Find the best SequenceMatcher ratio for *needle* among *haystack_sentences*.
+
+    Candidates that cannot reach *min_ratio* are skipped without computing the
+    full ratio, so a result below *min_ratio* is only a lower bound.
+    *haystack_matchers*, one ``reusable_matcher`` per haystack sentence, avoid
+    re-indexing the haystack for every needle.
+    """
     if needle in haystack_set:
         return 1.0
     best = 0.0
-    for hs in haystack_sentences:
+    for idx, hs in enumerate(haystack_sentences):
         if abs(len(needle) - len(hs)) > len(needle) * LENGTH_MISMATCH_RATIO:
             continue
-        ratio = SequenceMatcher(None, needle, hs).ratio()
+        if haystack_matchers is None:
+            matcher = SequenceMatcher(None, needle, hs, autojunk=False)
+        else:
+            matcher = haystack_matchers[idx]
+            matcher.set_seq1(needle)
+        if ratio_cannot_reach(matcher, max(best, min_ratio)):
+            continue
+        ratio = matcher.ratio()
         if ratio > best:
             best = ratio
         if best >= EARLY_EXIT_RATIO:
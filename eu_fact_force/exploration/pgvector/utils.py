@@ -1,5 +1,10 @@
+import heapq
+from contextlib import contextmanager
+
+import numpy as np
 import pandas as pd
-import psycopg2
+from pgvector.psycopg2 import register_vector
+from psycopg2.pool import ThreadedConnectionPool
 
 # Postgres connection and utils
 local_db_credentials = {
@@ -9,68 +14,127 @@ local_db_credentials = {
     "host": "localhost",
     "port": 5432,
 }
-connection = psycopg2.connect(**local_db_credentials)
+# Pooled connections: concurrent searches don't serialize on a single socket,
+# and a dropped connection is replaced instead of breaking every later call
+_POOL = ThreadedConnectionPool(minconn=2, maxconn=16, **local_db_credentials)
+_vector_registered = False
+
+
+@contextmanager
+def _connection():
+    conn = _POOL.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _POOL.putconn(conn, close=conn.closed != 0)
 
 
-def execute(sql):
-    with connection.cursor() as cursor:
-        cursor.execute(sql)
-    connection.commit()
+def _register_vector():
+    # The vector type only exists once the extension is created: register lazily,
+    # globally so that every pooled connection can send and read vectors
+    global _vector_registered
+    if not _vector_registered:
+        with _connection() as conn:
+            register_vector(conn, globally=True)
+        _vector_registered = True
 
 
-def query(sql):
-    with connection.cursor() as cursor:
-        cursor.execute(sql)
+def execute(sql, params=None):
+    with _connection() as conn, conn.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def query(sql, params=None):
+    with _connection() as conn, conn.cursor() as cursor:
+        cursor.execute(sql, params)
         records = cursor.fetchall()
         cols = [desc[0] for desc in cursor.description]
-    connection.commit()
     return pd.DataFrame(records, columns=cols)
 
 
+# Embedding model, loaded once and shared by all calls
+MODEL_NAME = "all-MiniLM-L6-v2"
+EMBED_BATCH_SIZE = 64
+_MODEL = None
+
+
+def get_model():
+    global _MODEL
+    if _MODEL is None:
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        _MODEL = SentenceTransformer(MODEL_NAME, device=device)
+        if device == "cuda":
+            # FP16 halves activation memory and roughly doubles GPU throughput
+            _MODEL = _MODEL.half()
+    return _MODEL
+
+
+def embed(texts):
+    # Unit-length vectors: cosine distance <=> ranks like inner product <#>
+    return get_model().encode(
+        texts,
+        batch_size=EMBED_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
+
 # Search functions
+DISTANCE_OPERATORS = {"euclidean": "<->", "cosine": "<=>"}
+
+
 def dense_search(input_vector, distance="cosine", n=5):
-    if distance == "euclidean":
-        sql = f"""
-        SELECT id, content, dense_vector <-> '{input_vector}' as distance, rank() over (order by dense_vector <-> '{input_vector}') FROM vector_store ORDER BY dense_vector <-> '{input_vector}' LIMIT {n};
-        """
-    elif distance == "cosine":
-        sql = f"""
-        SELECT id, content, dense_vector <=> '{input_vector}' as distance, rank() over (order by dense_vector <=> '{input_vector}')  FROM vector_store ORDER BY dense_vector <=> '{input_vector}' LIMIT {n};
-        """
-    else:
+    if distance not in DISTANCE_OPERATORS:
         raise NotImplementedError(f"Unknown distance: {distance}")
+    operator = DISTANCE_OPERATORS[distance]
 
-    return query(sql)
+    # Vector sent as a typed parameter: no SQL string building, plan can be reused
+    _register_vector()
+    vector = np.asarray(input_vector, dtype=np.float32)
+    # Inner ORDER BY ... LIMIT can use the vector index; the window only ranks n rows
+    sql = f"""
+        WITH candidates AS (
+            SELECT id, content, dense_vector {operator} %(vector)s as distance
+            FROM vector_store
+            ORDER BY dense_vector {operator} %(vector)s
+            LIMIT %(n)s
+        )
+        SELECT id, content, distance, rank() over (order by distance) FROM candidates ORDER BY distance;
+        """
+    return query(sql, {"vector": vector, "n": n})
 
 
 def sparse_search(input, n=5):
-    sql = f"""
-        SELECT id, content, ts_rank_cd(sparse_vector, query) AS similarity, rank() over (ORDER BY ts_rank_cd(sparse_vector, query) DESC) FROM vector_store, to_tsquery('{input}') query
+    sql = """
+        SELECT id, content, ts_rank_cd(sparse_vector, query) AS similarity, rank() over (ORDER BY ts_rank_cd(sparse_vector, query) DESC) FROM vector_store, to_tsquery(%(input)s) query
         WHERE query @@ sparse_vector
         ORDER BY similarity DESC
-        LIMIT {n};"""
-    return query(sql)
+        LIMIT %(n)s;"""
+    return query(sql, {"input": input, "n": n})
 
 
 # Hybrid search - reciprocal rank fusion
 def rrf_results(dense_df, sparse_df, alpha=60, n=5):
-    dense_df["score_rrf"] = 1 / (alpha + dense_df["rank"])
-    sparse_df["score_rrf"] = 1 / (alpha + sparse_df["rank"])
-
-    combined = pd.concat(
-        [
-            dense_df.loc[:, ["id", "content", "score_rrf"]],
-            sparse_df.loc[:, ["id", "content", "score_rrf"]],
-        ],
-        ignore_index=True,
-    )
+    # Plain dict accumulation: cheaper than concat + groupby for a few dozen rows
+    scores = {}
+    contents = {}
+    for df in (dense_df, sparse_df):
+        rrf_scores = 1.0 / (alpha + df["rank"].to_numpy())
+        for chunk_id, content, score in zip(df["id"].to_numpy(), df["content"].to_numpy(), rrf_scores):
+            # Sum RRF scores for chunks appearing in multiple sources
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + score
+            contents.setdefault(chunk_id, content)
 
-    # Sum RRF scores for chunks appearing in multiple sources
-    rrf_agg = (
-        combined.groupby("id", as_index=False)
-        .agg({"score_rrf": "sum", "content": "first"})
-        .sort_values("score_rrf", ascending=False)
-        .rename(columns={"score_rrf": "score"})
-        .head(n)
+    top = heapq.nlargest(n, scores.items(), key=lambda item: item[1])
+    return pd.DataFrame(
+        [(chunk_id, score, contents[chunk_id]) for chunk_id, score in top],
+        columns=["id", "score", "content"],
     )
-    return rrf_agg
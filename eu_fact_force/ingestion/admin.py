@@ -4,6 +4,7 @@ See the pages on <url>/admin
 """
 
 from django.contrib import admin
+from django.db.models.functions import Length, Substr
 
 from .models import Document, DocumentChunk, IngestionRun, ParsedArtifact, SourceFile
 
@@ -51,13 +52,25 @@ class DocumentChunkAdmin(admin.ModelAdmin):
     _CONTENT_PREVIEW_LENGTH = 80
 
     list_display = ("id", "document", "order", "content_preview", "created_at")
+    list_select_related = ("document",)
     list_filter = ("document",)
     raw_id_fields = ("document",)
     ordering = ("document", "order")
 
+    def get_queryset(self, request):
+        # Compute the preview in the database instead of fetching every full chunk text
+        return (
+            super()
+            .get_queryset(request)
+            .defer("content", "embedding")
+            .annotate(
+                _content_preview=Substr("content", 1, self._CONTENT_PREVIEW_LENGTH),
+                _content_length=Length("content"),
+            )
+        )
+
     @admin.display(description="Content")
     def content_preview(self, obj):
-        content = obj.content
-        if len(content) > self._CONTENT_PREVIEW_LENGTH:
-            return content[:self._CONTENT_PREVIEW_LENGTH] + "..."
-        return content
+        if obj._content_length > self._CONTENT_PREVIEW_LENGTH:
+            return obj._content_preview + "..."
+        return obj._content_preview
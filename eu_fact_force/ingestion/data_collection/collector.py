@@ -1,9 +1,12 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from eu_fact_force.ingestion.data_collection.parsers import PARSERS
 
 logger = logging.getLogger(__name__)
 
+FETCH_MAX_WORKERS = 16
+
 
 def _better(new, current):
     """Return True if new is a longer list or string than current."""
@@ -32,3 +35,21 @@ def fetch_all(doi: str) -> dict:
             if field not in merged or _better(value, merged[field]):
                 merged[field] = value
     return {"found": bool(sources), "sources": sources} | merged
+
+
+def _fetch_one(doi: str) -> dict:
+    """fetch_all for a single DOI, reporting a failure as not found instead of raising."""
+    try:
+        return fetch_all(doi)
+    except Exception as e:
+        logger.warning(f"Metadata fetch failed for {doi}: {e}")
+        return {"found": False, "sources": []}
+
+
+def fetch_all_many(dois: list[str], max_workers: int = FETCH_MAX_WORKERS) -> dict[str, dict]:
+    """Fetch metadata for many DOIs concurrently (I/O-bound), keyed by DOI.
+
+    A failing DOI is reported as not found without affecting the others.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(dois, executor.map(_fetch_one, dois)))
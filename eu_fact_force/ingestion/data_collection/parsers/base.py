@@ -1,8 +1,53 @@
 import logging
 import os
+import shutil
 from abc import ABC, abstractmethod
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_SIZE = 32
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+def _build_session() -> requests.Session:
+    """Build a session shared by all parsers, reusing connections (TLS, DNS) across DOIs."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+
+def stream_pdf(url: str, path: str) -> bool:
+    """
+    Stream url to path in fixed-size chunks, without buffering the whole PDF in memory.
+    Returns False (and leaves path untouched) if the content is not a PDF.
+    """
+    tmp_path = f"{path}.part"
+    try:
+        with SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            header = response.raw.read(4)
+            if header != b"%PDF":
+                return False
+            with open(tmp_path, "wb") as fh:
+                fh.write(header)
+                shutil.copyfileobj(response.raw, fh, length=STREAM_CHUNK_SIZE)
+        os.replace(tmp_path, path)
+        return True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def doi_to_id(doi: str) -> str:
@@ -34,29 +79,18 @@ class MetadataParser(ABC):
         """Return a list of candidate PDF URLs for a DOI, in order of preference."""
         pass
 
-    def _fetch_pdf_content(self, url: str) -> bytes | None:
-        """Fetch URL and return content if it is a valid PDF, else None."""
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        if not response.content.startswith(b"%PDF"):
-            self.logger.warning(
-                f"Content at {url} is not a valid PDF (possibly a paywall page)."
-            )
-            return None
-        return response.content
-
-    def _is_better_than_existing(self, path: str, content: bytes) -> bool:
-        """Return True if content should replace the file at path (larger or file absent)."""
+    def _is_better_than_existing(self, path: str, size: int) -> bool:
+        """Return True if a file of this size should replace the file at path (larger or file absent)."""
         if not os.path.exists(path):
             return True
-        return len(content) > os.path.getsize(path)
+        return size > os.path.getsize(path)
 
-    def _save_pdf(self, path: str, content: bytes) -> None:
-        """Write content to path, or skip if the existing file is already as large or larger."""
-        if self._is_better_than_existing(path, content):
-            with open(path, "wb") as f:
-                f.write(content)
+    def _save_pdf(self, path: str, downloaded_path: str) -> None:
+        """Move the downloaded file to path, or discard it if the existing file is already as large or larger."""
+        if self._is_better_than_existing(path, os.path.getsize(downloaded_path)):
+            os.replace(downloaded_path, path)
         else:
+            os.remove(downloaded_path)
             self.logger.info(
                 f"Skipping {path}: existing file is already as large or larger."
             )
@@ -64,14 +98,18 @@ class MetadataParser(ABC):
     def download_pdf(self, doi: str, output_dir: str = "pdf") -> bool:
         """Download the first valid PDF found and save it to output_dir. Returns True on success."""
         output_path = os.path.join(output_dir, f"{doi_to_id(doi)}.pdf")
+        downloaded_path = f"{output_path}.download"
         for url in self.get_pdf_url(doi):
             try:
-                content = self._fetch_pdf_content(url)
+                is_pdf = stream_pdf(url, downloaded_path)
             except Exception as e:
                 self.logger.error(f"Download failed for {url}: {e}")
                 continue
-            if content is None:
+            if not is_pdf:
+                self.logger.warning(
+                    f"Content at {url} is not a valid PDF (possibly a paywall page)."
+                )
                 continue
-            self._save_pdf(output_path, content)
+            self._save_pdf(output_path, downloaded_path)
             return True
         return False
@@ -1,6 +1,4 @@
-import requests
-
-from eu_fact_force.ingestion.data_collection.parsers.base import MetadataParser
+from eu_fact_force.ingestion.data_collection.parsers.base import SESSION, MetadataParser
 
 
 class CrossrefMetadataParser(MetadataParser):
@@ -55,7 +53,7 @@ class CrossrefMetadataParser(MetadataParser):
         return "published"
 
     def get_metadata(self, doi: str) -> dict:
-        response = requests.get(self.url.format(doi=doi))
+        response = SESSION.get(self.url.format(doi=doi))
         if response.status_code == 404:
             return {"found": False}
         response.raise_for_status()
@@ -79,7 +77,7 @@ class CrossrefMetadataParser(MetadataParser):
 
     def get_pdf_url(self, doi: str) -> list[str]:
         try:
-            response = requests.get(self.url.format(doi=doi), timeout=10)
+            response = SESSION.get(self.url.format(doi=doi), timeout=10)
             if response.status_code == 404:
                 return []
             response.raise_for_status()
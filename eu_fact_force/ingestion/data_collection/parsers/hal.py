@@ -1,6 +1,4 @@
-import requests
-
-from eu_fact_force.ingestion.data_collection.parsers.base import MetadataParser
+from eu_fact_force.ingestion.data_collection.parsers.base import SESSION, MetadataParser
 
 
 class HALMetadataParser(MetadataParser):
@@ -9,7 +7,9 @@ class HALMetadataParser(MetadataParser):
     def __init__(self):
         super().__init__()
         self.api_name = "hal"
-        self.url = "https://api.archives-ouvertes.fr/search/?q=doiId_s:{doi}&fl=*"
+        self.url = "https://api.archives-ouvertes.fr/search/?q=doiId_s:{doi}&fl=*&wt=json"
+        # PDF lookup only needs the record URI: avoid fetching and decoding every field
+        self.uri_url = "https://api.archives-ouvertes.fr/search/?q=doiId_s:{doi}&fl=uri_s&rows=1&wt=json"
 
     def _get_type(self, doc):
         return {"ART": "article", "THESIS": "thesis", "REPORT": "report"}.get(
@@ -20,7 +20,7 @@ class HALMetadataParser(MetadataParser):
         return next((doc[key] for key in ["mesh_s", "keyword_s"] if doc.get(key)), None)
 
     def get_metadata(self, doi: str) -> dict:
-        response = requests.get(self.url.format(doi=doi))
+        response = SESSION.get(self.url.format(doi=doi))
         response.raise_for_status()
         docs = response.json().get("response", {}).get("docs", [])
         if not docs:
@@ -43,7 +43,7 @@ class HALMetadataParser(MetadataParser):
 
     def get_pdf_url(self, doi: str) -> list[str]:
         try:
-            response = requests.get(self.url.format(doi=doi), timeout=10)
+            response = SESSION.get(self.uri_url.format(doi=doi), timeout=10)
             response.raise_for_status()
             docs = response.json().get("response", {}).get("docs", [])
             if not docs:
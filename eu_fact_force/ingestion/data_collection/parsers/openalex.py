@@ -1,6 +1,4 @@
-import requests
-
-from eu_fact_force.ingestion.data_collection.parsers.base import MetadataParser
+from eu_fact_force.ingestion.data_collection.parsers.base import SESSION, MetadataParser
 
 
 class OpenAlexMetadataParser(MetadataParser):
@@ -45,7 +43,7 @@ class OpenAlexMetadataParser(MetadataParser):
             return []
         results = []
         for i in range(0, len(ids), 100):
-            response = requests.get(
+            response = SESSION.get(
                 self.cited_articles_url.format(ids="|".join(ids[i: i + 100]))
             )
             response.raise_for_status()
@@ -60,7 +58,7 @@ class OpenAlexMetadataParser(MetadataParser):
         return (doc.get("doi") or "").removeprefix("https://doi.org/") or None
 
     def get_metadata(self, doi: str) -> dict:
-        response = requests.get(self.url.format(doi=doi))
+        response = SESSION.get(self.url.format(doi=doi))
         if response.status_code == 404:
             return {"found": False}
         response.raise_for_status()
@@ -84,7 +82,7 @@ class OpenAlexMetadataParser(MetadataParser):
 
     def get_pdf_url(self, doi: str) -> list[str]:
         try:
-            response = requests.get(self.url.format(doi=doi), timeout=10)
+            response = SESSION.get(self.url.format(doi=doi), timeout=10)
             if response.status_code == 404:
                 return []
             response.raise_for_status()
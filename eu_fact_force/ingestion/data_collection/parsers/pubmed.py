@@ -1,6 +1,4 @@
-import requests
-
-from eu_fact_force.ingestion.data_collection.parsers.base import MetadataParser
+from eu_fact_force.ingestion.data_collection.parsers.base import SESSION, MetadataParser
 
 
 class PubMedMetadataParser(MetadataParser):
@@ -13,7 +11,7 @@ class PubMedMetadataParser(MetadataParser):
         self.summary_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
 
     def _resolve_pubmed_id(self, doi: str):
-        response = requests.get(
+        response = SESSION.get(
             self.search_url,
             params={"db": "pubmed", "retmode": "json", "term": doi + "[DOI]"},
         )
@@ -38,7 +36,7 @@ class PubMedMetadataParser(MetadataParser):
         pubmed_id = self._resolve_pubmed_id(doi)
         if not pubmed_id:
             return {"found": False}
-        response = requests.get(
+        response = SESSION.get(
             self.summary_url,
             params={"db": "pubmed", "id": pubmed_id, "retmode": "json"},
         )
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.4 on 2026-10-15 09:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ingestion", "0008_author_model"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="documentchunk",
+            index=models.Index(fields=["document", "order"], name="docchunk_doc_order_idx"),
+        ),
+    ]
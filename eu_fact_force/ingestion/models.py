@@ -336,6 +336,9 @@ class DocumentChunk(TimeStampedModel):
         verbose_name = "document chunk"
         verbose_name_plural = "document chunks"
         ordering = ["document", "order"]
+        indexes = [
+            models.Index(fields=["document", "order"], name="docchunk_doc_order_idx")
+        ]
 
     def __str__(self):
         content = self.content
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.metadata
+import threading
 from pathlib import Path
 from typing import TypedDict
 
@@ -12,6 +13,8 @@ from hierarchical.postprocessor import ResultPostprocessor
 from eu_fact_force.ingestion.chunking import MAX_CHUNK_CHARS, split_into_paragraph_chunks
 from eu_fact_force.ingestion.parsing.docling_postprocess import render_docling_output
 
+_CONVERTERS = threading.local()
+
 
 class ParseResult(TypedDict):
     postprocessed_text: str
@@ -20,6 +23,21 @@ class ParseResult(TypedDict):
     chunks: list[str]
 
 
+def get_converter() -> DocumentConverter:
+    """Return this thread's Docling converter, building it on first use.
+
+    Loading the layout and table models dominates the cost of a conversion, so
+    the converter is built once and reused for every document. Docling does not
+    document DocumentConverter as safe for concurrent convert() calls, so each
+    thread gets its own instance rather than sharing one across threads.
+    """
+    converter = getattr(_CONVERTERS, "converter", None)
+    if converter is None:
+        converter = DocumentConverter()
+        _CONVERTERS.converter = converter
+    return converter
+
+
 def parse_file(
     file_path: Path,
     *,
@@ -38,7 +56,7 @@ def parse_file(
     Returns:
         ParseResult with postprocessed_text, docling_output, parser_config, and chunks.
     """
-    converter = DocumentConverter()
+    converter = get_converter()
     result = converter.convert(file_path)
     if postprocess:
         ResultPostprocessor(result).process()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import fitz as PyMuPDF
 
 
@@ -47,11 +49,14 @@ def rect_area_ratio(rect: PyMuPDF.Rect, page_rect: PyMuPDF.Rect) -> float:
     return (rect.width * rect.height) / (page_rect.width * page_rect.height)
 
 
-def build_docling_picture_regions_by_page(doc_dict: dict, pdf: PyMuPDF.Document) -> dict[int, list[PyMuPDF.Rect]]:
+def build_docling_picture_regions_by_page(
+    doc_dict: dict, pages: Sequence[PyMuPDF.Page]
+) -> dict[int, list[PyMuPDF.Rect]]:
     """
     Build picture regions by page from Docling dict.
 
     We treat text blocks mostly inside these regions as image OCR noise.
+    *pages* are the already loaded PDF pages, indexed from 0.
     """
     regions: dict[int, list[PyMuPDF.Rect]] = {}
     for item in doc_dict.get("pictures", []):
@@ -61,8 +66,8 @@ def build_docling_picture_regions_by_page(doc_dict: dict, pdf: PyMuPDF.Document)
                 continue
             page_no = int(prov.get("page_no", 1))
             page_idx = page_no - 1
-            if page_idx < 0 or page_idx >= len(pdf):
+            if page_idx < 0 or page_idx >= len(pages):
                 continue
-            rect = docling_bbox_to_rect(bbox, pdf[page_idx].rect.height)
+            rect = docling_bbox_to_rect(bbox, pages[page_idx].rect.height)
             regions.setdefault(page_no, []).append(rect)
     return regions
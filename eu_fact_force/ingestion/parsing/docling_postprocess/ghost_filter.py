@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Iterator
 
@@ -23,16 +24,16 @@ from .geometry import (
 )
 
 
-def rect_has_pdf_words(page: PyMuPDF.Page, rect: PyMuPDF.Rect, min_tokens: int = 1) -> bool:
-    """Check whether a PDF rect contains real extractable word tokens."""
+def rect_pdf_words(page: PyMuPDF.Page, rect: PyMuPDF.Rect, min_tokens: int = 1) -> list:
+    """Return the PDF words inside a rect, or [] when it has no real word tokens."""
     if not is_usable_rect(rect):
-        return False
+        return []
 
     words = page.get_text("words", clip=rect)
-    if not words:
-        return False
+    if not words or not has_min_meaningful_tokens(words, min_tokens=min_tokens):
+        return []
 
-    return has_min_meaningful_tokens(words, min_tokens=min_tokens)
+    return words
 
 
 def is_usable_rect(rect: PyMuPDF.Rect) -> bool:
@@ -62,9 +63,8 @@ def tokenize_for_overlap(text: str) -> set[str]:
     }
 
 
-def bbox_word_tokens(page: PyMuPDF.Page, rect: PyMuPDF.Rect) -> set[str]:
-    """Extract normalized word tokens from a PDF rectangle."""
-    words = page.get_text("words", clip=rect)
+def word_tokens(words: list) -> set[str]:
+    """Normalized tokens from already extracted PyMuPDF words."""
     if not words:
         return set()
     raw = " ".join(str(w[4]) for w in words if str(w[4]).strip())
@@ -72,20 +72,19 @@ def bbox_word_tokens(page: PyMuPDF.Page, rect: PyMuPDF.Rect) -> set[str]:
 
 
 def docling_text_agrees_with_pdf_words(
-    docling_text: str,
+    docling_tokens: set[str],
     pdf_tokens: set[str],
     min_overlap_ratio: float = DOCLING_PYMUPDF_MIN_TOKEN_OVERLAP_RATIO,
     min_shared_tokens: int = DOCLING_PYMUPDF_MIN_SHARED_TOKENS,
 ) -> bool:
     """
-    Check whether Docling text and PDF words in the same bbox reasonably agree.
+    Check whether Docling text tokens and PDF words in the same bbox reasonably agree.
 
     Prevents keeping gibberish Docling strings that happen to overlap valid text areas.
     """
     if not pdf_tokens:
         return False
 
-    docling_tokens = tokenize_for_overlap(docling_text)
     if not docling_tokens:
         return False
 
@@ -154,14 +153,16 @@ def _rect_and_area_ratio_from_prov(
     prov: dict, page: PyMuPDF.Page
 ) -> tuple[PyMuPDF.Rect, float]:
     """Build bbox rect and compute its area ratio against the page."""
-    rect = docling_bbox_to_rect(prov["bbox"], page.rect.height)
-    area_ratio = rect_area_ratio(rect, page.rect)
+    # page.rect is rebuilt by MuPDF on every access: read it once
+    page_rect = page.rect
+    rect = docling_bbox_to_rect(prov["bbox"], page_rect.height)
+    area_ratio = rect_area_ratio(rect, page_rect)
     return rect, area_ratio
 
 
 def _prov_supports_keep(
     *,
-    text: str,
+    text_tokens: set[str],
     label: str,
     page_no: int,
     page: PyMuPDF.Page,
@@ -183,11 +184,17 @@ def _prov_supports_keep(
     ):
         return True, False
 
-    if not rect_has_pdf_words(page, rect):
+    # Text without overlap tokens can never agree with the PDF words: skip the
+    # clipped extraction, by far the most expensive step here
+    if not text_tokens:
+        return False, False
+
+    # One clipped extraction serves both the word-presence check and the tokens
+    words = rect_pdf_words(page, rect)
+    if not words:
         return False, False
 
-    pdf_tokens = bbox_word_tokens(page, rect)
-    return False, docling_text_agrees_with_pdf_words(text, pdf_tokens)
+    return False, docling_text_agrees_with_pdf_words(text_tokens, word_tokens(words))
 
 
 def evaluate_text_block_keep(
@@ -195,7 +202,7 @@ def evaluate_text_block_keep(
     text: str,
     label: str,
     provs: list[dict],
-    pdf: PyMuPDF.Document,
+    pages: Sequence[PyMuPDF.Page],
     picture_regions: dict[int, list[PyMuPDF.Rect]],
 ) -> tuple[bool, float]:
     """Evaluate whether a text block should be kept and return max bbox area ratio."""
@@ -203,24 +210,26 @@ def evaluate_text_block_keep(
     if not provs:
         return True, 0.0
 
+    # Tokenized once per block, shared by every provenance check below
+    text_tokens = tokenize_for_overlap(text)
     keep = False
     prov_count = 0
     prov_inside_picture_count = 0
     max_bbox_area_ratio = 0.0
 
     for prov in provs:
-        parsed_page = _parse_prov_page_index(prov=prov, page_count=len(pdf))
+        parsed_page = _parse_prov_page_index(prov=prov, page_count=len(pages))
         if parsed_page is None:
             continue
         page_no, page_idx = parsed_page
         prov_count += 1
 
-        page = pdf[page_idx]
+        page = pages[page_idx]
         rect, area_ratio = _rect_and_area_ratio_from_prov(prov=prov, page=page)
         max_bbox_area_ratio = max(max_bbox_area_ratio, area_ratio)
 
         is_inside_picture, supports_keep = _prov_supports_keep(
-            text=text,
+            text_tokens=text_tokens,
             label=label,
             page_no=page_no,
             page=page,
@@ -261,14 +270,17 @@ def collect_docling_ghost_text_blocks(
 
     pdf = PyMuPDF.open(str(file_path))
     try:
-        picture_regions = build_docling_picture_regions_by_page(doc_dict, pdf)
+        # Load each page once: both the picture-region pass and every text
+        # provenance on the same page reuse it instead of re-indexing the document
+        pages = list(pdf)
+        picture_regions = build_docling_picture_regions_by_page(doc_dict, pages)
         for text, label, provs in iter_scored_text_items(text_items):
             considered += 1
             keep, max_bbox_area_ratio = evaluate_text_block_keep(
                 text=text,
                 label=label,
                 provs=provs,
-                pdf=pdf,
+                pages=pages,
                 picture_regions=picture_regions,
             )
             if keep:
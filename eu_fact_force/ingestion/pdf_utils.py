@@ -5,14 +5,13 @@ import fitz
 
 def extract_text_by_blocks(pdf_bytes: bytes) -> str:
     """Extract text from the first 3 pages of a PDF, sorted by visual reading order."""
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    text = ""
-    for page in doc[:3]:
-        blocks = page.get_text("blocks")
-        blocks.sort(key=lambda b: (round(b[1] / 20), b[0]))
-        for block in blocks:
-            text += block[4] + "\n"
-    return text
+    parts = []
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc.pages(0, min(3, doc.page_count)):
+            blocks = page.get_text("blocks")
+            blocks.sort(key=lambda b: (round(b[1] / 20), b[0]))
+            parts.extend(block[4] + "\n" for block in blocks)
+    return "".join(parts)
 
 
 def extract_doi_from_pdf(text: str) -> str | None:
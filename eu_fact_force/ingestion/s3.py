@@ -1,4 +1,3 @@
-import io
 import os
 from pathlib import Path
 
@@ -71,8 +70,9 @@ def save_file_to_s3(file_path: Path) -> str:
             "AWS_STORAGE_BUCKET_NAME must be set to upload files to S3."
         )
 
-    file_content = file_path.read_bytes()
     s3_key = f"ingestion/sources/{file_path.name}"
     client = get_s3_client()
-    client.upload_fileobj(io.BytesIO(file_content), bucket, s3_key)
+    # Stream from disk: the file is never fully loaded in memory.
+    with file_path.open("rb") as fh:
+        client.upload_fileobj(fh, bucket, s3_key, Config=settings.AWS_S3_TRANSFER_CONFIG)
     return s3_key
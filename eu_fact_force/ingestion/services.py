@@ -7,11 +7,9 @@ import logging
 import os
 from pathlib import Path
 
-import requests
-
 from eu_fact_force.ingestion.data_collection.collector import fetch_all
 from eu_fact_force.ingestion.data_collection.parsers import PARSERS
-from eu_fact_force.ingestion.data_collection.parsers.base import doi_to_id
+from eu_fact_force.ingestion.data_collection.parsers.base import doi_to_id, stream_pdf
 from eu_fact_force.ingestion.embedding import add_embeddings
 from eu_fact_force.ingestion.models import (
     Author,
@@ -28,6 +26,8 @@ from eu_fact_force.ingestion.pdf_utils import (
 )
 
 PIPELINE_VERSION = "0.1.0"
+# Rows per INSERT: keeps statements under Postgres parameter limits for long documents.
+CHUNK_BULK_CREATE_BATCH_SIZE = 1000
 
 
 class DuplicateDOIError(Exception):
@@ -179,7 +179,7 @@ def _chunk_and_embed(document: Document, chunks: list[str], run: IngestionRun) -
         DocumentChunk(document=document, content=chunk, order=order)
         for order, chunk in enumerate(chunks, start=1)
     ]
-    DocumentChunk.objects.bulk_create(chunk_objs)
+    DocumentChunk.objects.bulk_create(chunk_objs, batch_size=CHUNK_BULK_CREATE_BATCH_SIZE)
     chunk_objs = list(DocumentChunk.objects.filter(document=document).order_by("order"))
     add_embeddings(chunk_objs)
 
@@ -189,11 +189,7 @@ def _download_pdf_from_url(pdf_url: str, output_path: Path) -> bool:
     Try to download a PDF from a direct URL using browser-like headers. Returns True on success.
     """
     try:
-        response = requests.get(pdf_url, timeout=30)
-        response.raise_for_status()
-        if response.content.startswith(b"%PDF"):
-            with open(output_path, "wb") as fh:
-                fh.write(response.content)
+        if stream_pdf(pdf_url, str(output_path)):
             return True
         logging.warning(
             "Content at %s is not a valid PDF (possibly a paywall page).", pdf_url
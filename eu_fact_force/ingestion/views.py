@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+from django.db.models import Count
 from django.http import JsonResponse
 from django.shortcuts import render
 
@@ -12,7 +13,7 @@ from eu_fact_force.ingestion.search import (
     search_narrative,
 )
 
-from eu_fact_force.ingestion.models import DocumentChunk
+from eu_fact_force.ingestion.models import Document
 
 from .forms import IngestForm
 from .services import DuplicateDOIError, ingest_by_doi
@@ -31,12 +32,18 @@ def ingest(request):
             doi = form.cleaned_data["doi"]
             try:
                 run = ingest_by_doi(doi)
+                # One query for the source file and the chunk count
+                document = (
+                    Document.objects.select_related("source_file")
+                    .annotate(chunks_count=Count("chunks"))
+                    .get(pk=run.document_id)
+                )
                 context.update(
                     {
                         "success": True,
                         "doi": doi,
-                        "source_file": run.document.source_file,
-                        "elements_count": DocumentChunk.objects.filter(document=run.document).count(),
+                        "source_file": document.source_file,
+                        "elements_count": document.chunks_count,
                     }
                 )
             except DuplicateDOIError as e:
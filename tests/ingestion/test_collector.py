@@ -0,0 +1,32 @@
+"""Tests for fetching metadata for many DOIs at once."""
+
+from unittest.mock import patch
+
+from eu_fact_force.ingestion.data_collection.collector import fetch_all_many
+
+
+def _fake_fetch_all(doi):
+    if doi == "10.1234/broken":
+        raise RuntimeError("API timeout")
+    return {"found": True, "sources": ["FakeParser"], "title": f"Title of {doi}"}
+
+
+@patch("eu_fact_force.ingestion.data_collection.collector.fetch_all", side_effect=_fake_fetch_all)
+def test_fetch_all_many_maps_results_by_doi(mock_fetch):
+    dois = [f"10.1234/doc-{i}" for i in range(20)]
+
+    results = fetch_all_many(dois, max_workers=4)
+
+    assert list(results) == dois
+    for doi in dois:
+        assert results[doi]["title"] == f"Title of {doi}"
+    assert mock_fetch.call_count == len(dois)
+
+
+@patch("eu_fact_force.ingestion.data_collection.collector.fetch_all", side_effect=_fake_fetch_all)
+def test_fetch_all_many_isolates_failing_doi(mock_fetch):
+    results = fetch_all_many(["10.1234/ok", "10.1234/broken", "10.1234/also-ok"])
+
+    assert results["10.1234/broken"] == {"found": False, "sources": []}
+    assert results["10.1234/ok"]["title"] == "Title of 10.1234/ok"
+    assert results["10.1234/also-ok"]["title"] == "Title of 10.1234/also-ok"
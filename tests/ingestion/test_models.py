@@ -25,7 +25,7 @@ class TestSourceFile:
         with fn.open("w") as f:
             f.write("test content")
 
-        def fake_upload_fileobj(Fileobj, Bucket, Key):
+        def fake_upload_fileobj(Fileobj, Bucket, Key, Config=None):
             dest = tmp_storage / Key
             dest.parent.mkdir(parents=True, exist_ok=True)
             dest.write_bytes(Fileobj.read())
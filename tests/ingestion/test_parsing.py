@@ -1,10 +1,11 @@
 """Tests for the production Docling parsing module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from eu_fact_force.ingestion.parsing.docling_parser import parse_file
+from eu_fact_force.ingestion.parsing.docling_parser import get_converter, parse_file
 
 FIXTURE_PDF = Path(__file__).parent / "fixtures" / "jhab032.pdf"
 
@@ -55,3 +56,13 @@ def test_parse_file_chunks_are_strings():
     chunks = result["chunks"]
     assert len(chunks) >= 1
     assert all(isinstance(c, str) and c for c in chunks)
+
+
+def test_get_converter_is_reused():
+    assert get_converter() is get_converter()
+
+
+def test_get_converter_is_per_thread():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other = pool.submit(get_converter).result()
+    assert other is not get_converter()
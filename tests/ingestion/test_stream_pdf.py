@@ -0,0 +1,70 @@
+"""Tests for streaming PDF downloads to disk."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from eu_fact_force.ingestion.data_collection.parsers.base import STREAM_CHUNK_SIZE, stream_pdf
+from eu_fact_force.ingestion.services import _download_pdf_from_url
+
+PDF_BODY = b"%PDF-1.7\n" + b"x" * (3 * STREAM_CHUNK_SIZE + 123) + b"\n%%EOF"
+
+
+def _fake_response(body: bytes, status_error: Exception | None = None) -> MagicMock:
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(body)
+    if status_error is not None:
+        response.raise_for_status.side_effect = status_error
+    return response
+
+
+@patch("eu_fact_force.ingestion.data_collection.parsers.base.SESSION")
+def test_stream_pdf_writes_whole_body(mock_session, tmp_path):
+    mock_session.get.return_value = _fake_response(PDF_BODY)
+    path = tmp_path / "doc.pdf"
+
+    assert stream_pdf("https://example.org/doc.pdf", str(path)) is True
+    assert path.read_bytes() == PDF_BODY
+    assert not (tmp_path / "doc.pdf.part").exists()
+    assert mock_session.get.call_args.kwargs["stream"] is True
+
+
+@patch("eu_fact_force.ingestion.data_collection.parsers.base.SESSION")
+def test_stream_pdf_rejects_non_pdf(mock_session, tmp_path):
+    mock_session.get.return_value = _fake_response(b"<html>paywall</html>")
+    path = tmp_path / "doc.pdf"
+
+    assert stream_pdf("https://example.org/doc.pdf", str(path)) is False
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("eu_fact_force.ingestion.data_collection.parsers.base.SESSION")
+def test_stream_pdf_keeps_existing_file_on_error(mock_session, tmp_path):
+    mock_session.get.return_value = _fake_response(
+        PDF_BODY, status_error=requests.HTTPError("503")
+    )
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF previous")
+
+    with pytest.raises(requests.HTTPError):
+        stream_pdf("https://example.org/doc.pdf", str(path))
+    assert path.read_bytes() == b"%PDF previous"
+    assert not (tmp_path / "doc.pdf.part").exists()
+
+
+@patch("eu_fact_force.ingestion.data_collection.parsers.base.SESSION")
+def test_download_pdf_from_url(mock_session, tmp_path):
+    path = tmp_path / "doc.pdf"
+
+    mock_session.get.return_value = _fake_response(PDF_BODY)
+    assert _download_pdf_from_url("https://example.org/doc.pdf", path) is True
+    assert path.read_bytes() == PDF_BODY
+
+    mock_session.get.return_value = _fake_response(b"<html>paywall</html>")
+    assert _download_pdf_from_url("https://example.org/other.pdf", tmp_path / "other.pdf") is False
+
+    mock_session.get.side_effect = requests.ConnectionError("down")
+    assert _download_pdf_from_url("https://example.org/down.pdf", tmp_path / "down.pdf") is False
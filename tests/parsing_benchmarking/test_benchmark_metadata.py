@@ -0,0 +1,69 @@
+"""Tests for the parsing benchmark metadata detectors."""
+
+import pytest
+
+from eu_fact_force.exploration.parsing_benchmarking.benchmarking.benchmark_metadata import (
+    detect_abstract,
+    detect_all,
+    detect_doi,
+    detect_global_metadata,
+    detect_references,
+    detect_title,
+)
+
+F, N = "found", "not_found"
+
+# (text, (has_doi, has_abstract, has_references)) as the three separate searches report them
+GLOBAL_METADATA_CASES = [
+    ("", (N, N, N)),
+    ("Abstract\nBody text.\nReferences\n1. Someone (2020).", (N, F, F)),
+    ("doi: 10.1234/abcd.5678 and nothing else", (F, N, N)),
+    # The DOI match runs over the glued heading, which must still not count as one
+    ("https://doi.org/10.1093/jhab032ABSTRACT follows the identifier", (F, N, N)),
+    ("Nonabstract prose with preferences and referencesX only", (N, N, N)),
+    ("REFERENCES\n10.12/too-short-registrant", (N, N, F)),
+    ("abstract 10.55555/x references", (F, F, F)),
+]
+
+
+@pytest.mark.parametrize("text,expected", GLOBAL_METADATA_CASES)
+def test_detect_global_metadata(text, expected):
+    has_doi, has_abstract, has_references = expected
+    assert detect_global_metadata(text) == {
+        "has_doi": has_doi,
+        "has_abstract": has_abstract,
+        "has_references": has_references,
+    }
+    assert (detect_doi(text), detect_abstract(text), detect_references(text)) == expected
+
+
+def test_detect_all_scores_found_fields():
+    text = "A Study Title For Testing\nJohn Smith\nAbstract\n10.1234/xyz\nReferences"
+    detected = detect_all(text, text)
+
+    assert detected["has_doi"] == "found"
+    assert detected["has_abstract"] == "found"
+    assert detected["has_references"] == "found"
+    assert detected["metadata_score"] == 5
+
+
+TITLE = "A Proper Paper Title Here"
+
+
+@pytest.mark.parametrize(
+    "first_chunk,expected",
+    [
+        ("", N),
+        ("short\n" * 3 + TITLE, F),
+        ("   \n\n  " + TITLE + "  ", F),
+        # Only the first TITLE_SCAN_LINES lines are considered
+        ("x\n" * 10 + TITLE, N),
+        ("y" * 400, N),
+        # Form feeds and bare carriage returns are line boundaries too (str.splitlines)
+        ("x\x0c" * 12 + TITLE, N),
+        ("x\r" * 12 + TITLE, N),
+        ("x\r\n" * 3 + TITLE, F),
+    ],
+)
+def test_detect_title(first_chunk, expected):
+    assert detect_title(first_chunk) == expected
@@ -0,0 +1,125 @@
+"""Tests for the parsing benchmark structural scoring."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from eu_fact_force.exploration.parsing_benchmarking.scoring.content import (
+    MIN_PARAGRAPH_CHARS,
+    MIN_SECTION_POSITIONS,
+    score_duplicate_content,
+    score_section_order,
+)
+from eu_fact_force.exploration.parsing_benchmarking.scoring.utils import (
+    normalize_for_dedup,
+)
+
+HEADING_WORDS = [
+    "intro",
+    "introduction",
+    "methods",
+    "method",
+    "results",
+    "discussion",
+    "a",
+    "conclusion",
+    "Results and Discussion",
+]
+
+
+def _pairwise_section_order(headings: list[str], sections: list[str]) -> float | None:
+    """Reference: first substring match per section, all-pairs concordance."""
+    if not sections or len(sections) < MIN_SECTION_POSITIONS or not headings:
+        return None
+    positions = []
+    for expected in (s.lower() for s in sections):
+        for idx, found in enumerate(headings):
+            if expected in found or found in expected:
+                positions.append(idx)
+                break
+    if len(positions) < MIN_SECTION_POSITIONS:
+        return None
+    pairs = [
+        (i, j) for i in range(len(positions)) for j in range(i + 1, len(positions))
+    ]
+    correct = sum(positions[i] < positions[j] for i, j in pairs)
+    return round(correct / len(pairs), 4) if pairs else None
+
+
+@pytest.mark.parametrize(
+    "text,sections,expected",
+    [
+        (
+            "# Introduction\n## Methods\n## Results\n# Discussion",
+            ["Introduction", "Methods", "Results"],
+            1.0,
+        ),
+        (
+            "# Results\n# Methods\n# Introduction",
+            ["Introduction", "Methods", "Results"],
+            0.0,
+        ),
+        (
+            "# Introduction\n# Results\n# Methods",
+            ["Introduction", "Methods", "Results"],
+            0.6667,
+        ),
+        # A heading containing the section name matches before a later exact heading
+        ("# Results and Discussion\n# Methods\n# Results", ["Methods", "Results"], 0.0),
+        ("Plain text without headings", ["Introduction", "Methods"], None),
+        ("# Introduction\n# Methods", ["Introduction"], None),
+    ],
+)
+def test_score_section_order(text, sections, expected):
+    assert score_section_order(text, sections) == expected
+
+
+def test_score_section_order_matches_pairwise_reference():
+    rng = random.Random(1)
+    for _ in range(2000):
+        headings = [rng.choice(HEADING_WORDS) for _ in range(rng.randint(0, 8))]
+        text = "\n".join("#" * rng.randint(1, 3) + " " + h for h in headings)
+        found = [h.lower() for h in headings]
+        sections = [rng.choice(HEADING_WORDS) for _ in range(rng.randint(0, 6))]
+        assert score_section_order(text, sections) == _pairwise_section_order(
+            found, sections
+        )
+
+
+PARAGRAPH = "Vaccination coverage in the cohort rose steadily over the study period."
+OTHER = "Participants reported fewer adverse events than in the 2019 survey round."
+
+
+def _counted_duplicate_ratio(text: str) -> float:
+    """Reference: Counter over normalised paragraphs, extra copies are duplicates."""
+    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    paragraphs = [p for p in paragraphs if len(p) >= MIN_PARAGRAPH_CHARS]
+    if len(paragraphs) < 2:
+        return 0.0
+    counts = Counter(normalize_for_dedup(p) for p in paragraphs)
+    duplicates = sum(count - 1 for count in counts.values() if count > 1)
+    return round(duplicates / len(paragraphs), 4)
+
+
+@pytest.mark.parametrize(
+    "paragraphs,expected",
+    [
+        ([PARAGRAPH, OTHER], 0.0),
+        ([PARAGRAPH, OTHER, PARAGRAPH], 0.3333),
+        # Case, whitespace and digits are normalised away before comparing
+        ([PARAGRAPH, PARAGRAPH.upper(), OTHER, OTHER.replace("2019", "2021")], 0.5),
+        ([PARAGRAPH, "Too short to count.", "Too short to count."], 0.0),
+        ([PARAGRAPH], 0.0),
+    ],
+)
+def test_score_duplicate_content(paragraphs, expected):
+    assert score_duplicate_content("\n\n".join(paragraphs)) == expected
+
+
+def test_score_duplicate_content_matches_counter_reference():
+    rng = random.Random(2)
+    pool = [PARAGRAPH, OTHER, PARAGRAPH.lower(), OTHER + " 42", "short one"]
+    for _ in range(500):
+        text = "\n\n".join(rng.choice(pool) for _ in range(rng.randint(0, 10)))
+        assert score_duplicate_content(text) == _counted_duplicate_ratio(text)
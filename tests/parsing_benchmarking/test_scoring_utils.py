@@ -0,0 +1,120 @@
+"""Tests for the parsing benchmark scoring helpers."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from eu_fact_force.exploration.parsing_benchmarking.scoring.similarity import (
+    compute_content_recall,
+)
+from eu_fact_force.exploration.parsing_benchmarking.scoring.utils import (
+    EARLY_EXIT_RATIO,
+    LENGTH_MISMATCH_RATIO,
+    best_match_ratio,
+    build_reference_text_index,
+    find_reference_text_path,
+    normalize_for_similarity,
+    reusable_matcher,
+    split_sentences,
+)
+
+WORDS = (
+    "vaccine public health trial cohort exposure outcome risk dose study "
+    "patients children adults infection measles policy data survey results"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))) + "."
+
+
+def _add_noise(text: str, rng: random.Random, noise: float) -> str:
+    chars = list(text)
+    for _ in range(int(len(chars) * noise)):
+        chars[rng.randrange(len(chars))] = rng.choice("abcdefg .")
+    return "".join(chars)
+
+
+def _exhaustive_best_ratio(needle: str, haystack_sentences: list[str]) -> float:
+    """Reference sweep: every length-compatible sentence, no pruning."""
+    if needle in haystack_sentences:
+        return 1.0
+    best = 0.0
+    for hs in haystack_sentences:
+        if abs(len(needle) - len(hs)) > len(needle) * LENGTH_MISMATCH_RATIO:
+            continue
+        ratio = SequenceMatcher(None, needle, hs, autojunk=False).ratio()
+        if ratio > best:
+            best = ratio
+        if best >= EARLY_EXIT_RATIO:
+            break
+    return best
+
+
+@pytest.mark.parametrize("noise", [0.05, 0.10, 0.15, 0.20, 0.25])
+def test_best_match_ratio_matches_exhaustive_sweep(noise):
+    """Pruning never drops a match that reaches the threshold."""
+    threshold = 0.8
+    rng = random.Random(int(noise * 100))
+    reference = [_sentence(rng) for _ in range(60)]
+    extracted = [_add_noise(s, rng, noise) for s in reference]
+    rng.shuffle(extracted)
+    extracted_set = set(extracted)
+    extracted_matchers = [reusable_matcher(s) for s in extracted]
+
+    for needle in reference:
+        expected = _exhaustive_best_ratio(needle, extracted)
+        got = best_match_ratio(needle, extracted, extracted_set, threshold)
+        got_indexed = best_match_ratio(
+            needle, extracted, extracted_set, threshold, extracted_matchers
+        )
+        if expected >= threshold:
+            assert got == got_indexed == expected
+        else:
+            assert got < threshold and got_indexed < threshold
+
+
+@pytest.mark.parametrize("noise", [0.10, 0.20])
+def test_content_recall_matches_exhaustive_sweep(noise):
+    threshold = 0.8
+    rng = random.Random(int(noise * 100))
+    reference = " ".join(_sentence(rng) for _ in range(60))
+    extracted = _add_noise(reference, rng, noise)
+    ref_sentences = split_sentences(normalize_for_similarity(reference))
+    ext_sentences = split_sentences(normalize_for_similarity(extracted))
+
+    expected = sum(
+        best
+        for ref_s in ref_sentences
+        if (best := _exhaustive_best_ratio(ref_s, ext_sentences)) >= threshold
+    )
+    assert compute_content_recall(extracted, reference, threshold) == round(
+        expected / len(ref_sentences), 4
+    )
+
+
+def test_best_match_ratio_exact_hit():
+    sentences = ["the first sentence of the body text.", "another sentence here."]
+    assert best_match_ratio(sentences[1], sentences, set(sentences), 0.8) == 1.0
+
+
+def test_build_reference_text_index_extension_precedence(tmp_path):
+    # Created in reverse precedence order so directory order cannot decide
+    for name in ("both.txt", "both.md", "txt_only.txt", "md_only.md", "other.pdf"):
+        (tmp_path / name).write_text("body", encoding="utf-8")
+    (tmp_path / "folder.md").mkdir()
+
+    index = build_reference_text_index(tmp_path)
+
+    assert index == {
+        "both": tmp_path / "both.md",
+        "txt_only": tmp_path / "txt_only.txt",
+        "md_only": tmp_path / "md_only.md",
+    }
+    for stem in ("both", "txt_only", "md_only", "other", "missing"):
+        assert index.get(stem) == find_reference_text_path(stem, tmp_path)
+
+
+def test_build_reference_text_index_missing_dir(tmp_path):
+    assert build_reference_text_index(tmp_path / "missing") == {}